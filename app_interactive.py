@@ -1,7 +1,10 @@
 import os
 import sys
-import glob
 import time
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from types import SimpleNamespace
 from typing import List, Dict, Any, Tuple, Set, Optional
 
 ANSI_ENABLED = (
@@ -10,62 +13,77 @@ ANSI_ENABLED = (
     and os.getenv("RETRO_NO_COLOR") is None
 )
 
-
-def _ansi(code: str) -> str:
-    """Return ANSI escape code if coloring is enabled."""
-    return code if ANSI_ENABLED else ""
-
 from src.parameterizer import SQLParameterizer
 from src.quality import calculate_tool_quality_score, generate_semantic_description
 from src.labels import generate_labels
 from src.validation import validate_tool_advanced, create_tool
-from src.io_operations import load_jsonl, save_jsonl, merge_yaml, normalize
+from src.io_operations import iter_jsonl, normalize, YAMLToolStream
 from src.utils import sha, generate_smart_tool_name
 
 # ======  8-BIT RETRO DESIGN ======
-class RetroColors:
-    """8-bit arcade terminal renkleri - ULTRA RETRO MODE"""
+# 8-bit arcade terminal renkleri - ULTRA RETRO MODE
+_RETRO_CODES = {
     # 8-bit arcade colors
-    CYAN = _ansi('\033[96m')      # Electric cyan
-    MAGENTA = _ansi('\033[95m')   # Neon magenta
-    GREEN = _ansi('\033[92m')     # Matrix green
-    YELLOW = _ansi('\033[93m')    # Arcade yellow
-    RED = _ansi('\033[91m')       # Laser red
-    BLUE = _ansi('\033[94m')      # Cyber blue
-    WHITE = _ansi('\033[97m')     # Pure white
-    GRAY = _ansi('\033[90m')      # Dark gray
-    ORANGE = _ansi('\033[38;5;208m')  # 8-bit orange
-    PURPLE = _ansi('\033[38;5;129m')  # 8-bit purple
-    PINK = _ansi('\033[38;5;201m')    # 8-bit pink
-    LIME = _ansi('\033[38;5;154m')    # 8-bit lime
+    "CYAN": '\033[96m',      # Electric cyan
+    "MAGENTA": '\033[95m',   # Neon magenta
+    "GREEN": '\033[92m',     # Matrix green
+    "YELLOW": '\033[93m',    # Arcade yellow
+    "RED": '\033[91m',       # Laser red
+    "BLUE": '\033[94m',      # Cyber blue
+    "WHITE": '\033[97m',     # Pure white
+    "GRAY": '\033[90m',      # Dark gray
+    "ORANGE": '\033[38;5;208m',  # 8-bit orange
+    "PURPLE": '\033[38;5;129m',  # 8-bit purple
+    "PINK": '\033[38;5;201m',    # 8-bit pink
+    "LIME": '\033[38;5;154m',    # 8-bit lime
 
     # 8-bit styles
-    BOLD = _ansi('\033[1m')
-    DIM = _ansi('\033[2m')
-    UNDERLINE = _ansi('\033[4m')
-    BLINK = _ansi('\033[5m')      # Retro blink!
-    REVERSE = _ansi('\033[7m')    # Reverse video
-    ITALIC = _ansi('\033[3m')     # Italic
-    STRIKE = _ansi('\033[9m')     # Strikethrough
-
-    END = _ansi('\033[0m')
-
-    # 8-bit arcade combinations
-    TITLE = BOLD + CYAN
-    PROMPT = BOLD + WHITE
-    SUCCESS = BOLD + GREEN
-    ERROR = BOLD + RED
-    WARNING = BOLD + YELLOW
-    INFO = BOLD + WHITE
-    HIGHLIGHT = BOLD + MAGENTA
-    ARCADE = BOLD + CYAN
-    NEON = BOLD + WHITE
-    CYBER = BOLD + CYAN
+    "BOLD": '\033[1m',
+    "DIM": '\033[2m',
+    "UNDERLINE": '\033[4m',
+    "BLINK": '\033[5m',      # Retro blink!
+    "REVERSE": '\033[7m',    # Reverse video
+    "ITALIC": '\033[3m',     # Italic
+    "STRIKE": '\033[9m',     # Strikethrough
+
+    "END": '\033[0m',
+}
+
+# 8-bit arcade combinations
+_RETRO_COMBOS = {
+    "TITLE": ("BOLD", "CYAN"),
+    "PROMPT": ("BOLD", "WHITE"),
+    "SUCCESS": ("BOLD", "GREEN"),
+    "ERROR": ("BOLD", "RED"),
+    "WARNING": ("BOLD", "YELLOW"),
+    "INFO": ("BOLD", "WHITE"),
+    "HIGHLIGHT": ("BOLD", "MAGENTA"),
+    "ARCADE": ("BOLD", "CYAN"),
+    "NEON": ("BOLD", "WHITE"),
+    "CYBER": ("BOLD", "CYAN"),
+}
+
+def _build_retro_colors() -> SimpleNamespace:
+    """Resolve every color and combination once against ANSI_ENABLED"""
+    codes = {name: (code if ANSI_ENABLED else "") for name, code in _RETRO_CODES.items()}
+    for name, parts in _RETRO_COMBOS.items():
+        codes[name] = "".join(codes[part] for part in parts)
+    return SimpleNamespace(**codes)
+
+RetroColors = _build_retro_colors()
+
+# Per-record report emitted by run_processing, colors baked in at import
+_RECORD_TMPL = (
+    f"{RetroColors.SUCCESS}🎮 [{{n}}] {{key}}{RetroColors.END}\n"
+    f"   {RetroColors.CYBER}📝 {{desc}}{RetroColors.END}\n"
+    f"   {RetroColors.ARCADE}🔧 {{param_count}} parameters{RetroColors.END}\n"
+    f"   {RetroColors.NEON}⭐ Quality: {{quality:.1f}}/100{RetroColors.END}\n"
+    f"   {RetroColors.DIM}   {'─' * 60}{RetroColors.END}\n"
+    "\n"
+)
 
 def print_8bit_ascii_art():
     """MEGA 8-bit ASCII art banner with animation effect"""
-    import time
-    
     # Animated loading effect
     print(f"{RetroColors.CYBER}🎮 Initializing 8-bit arcade mode...{RetroColors.END}")
     for i in range(3):
@@ -104,7 +122,6 @@ def print_8bit_ascii_art():
 
 def print_loading_animation():
     """8-bit loading animation"""
-    import time
     frames = [
         f"{RetroColors.CYBER}🎮 Loading{RetroColors.END}",
         f"{RetroColors.NEON}⚡ Loading.{RetroColors.END}",
@@ -118,20 +135,35 @@ def print_loading_animation():
             time.sleep(0.2)
     print()
 
-def print_progress_bar(current: int, total: int, width: int = 50):
+_BAR_WIDTH = 50
+
+# Every bar the default width can show, colored per segment instead of per cell
+_BARS = [
+    f"{RetroColors.CYBER}{'█' * filled}{RetroColors.END}{RetroColors.GRAY}{'░' * (_BAR_WIDTH - filled)}{RetroColors.END}"
+    for filled in range(_BAR_WIDTH + 1)
+]
+
+def print_progress_bar(current: int, total: int, width: int = _BAR_WIDTH):
     """8-bit style progress bar"""
-    import time
-    
     progress = current / total
     filled = int(width * progress)
-    bar = f"{RetroColors.CYBER}█{RetroColors.END}" * filled + f"{RetroColors.GRAY}░{RetroColors.END}" * (width - filled)
+    if width == _BAR_WIDTH:
+        bar = _BARS[filled]
+    else:
+        bar = f"{RetroColors.CYBER}{'█' * filled}{RetroColors.END}{RetroColors.GRAY}{'░' * (width - filled)}{RetroColors.END}"
     percentage = int(progress * 100)
     
     print(f"\r{RetroColors.ARCADE}🎮 Progress: {RetroColors.END}[{bar}] {percentage}%", end='', flush=True)
     if current == total:
         print(f"\n{RetroColors.SUCCESS}✅ Complete!{RetroColors.END}")
 
-def print_retro_header(title: str):
+def print_progress_count(current: int, done: bool = False):
+    """8-bit style progress counter for a stream whose length is not known up front"""
+    print(f"\r{RetroColors.ARCADE}🎮 Progress: {RetroColors.END}{current} records", end='', flush=True)
+    if done:
+        print(f"\n{RetroColors.SUCCESS}✅ Complete!{RetroColors.END}")
+
+def _print_retro_header_retro(title: str):
     """MEGA 8-bit retro style header"""
     print(f"\n{RetroColors.CYAN}╔{'═' * 58}╗{RetroColors.END}")
     print(f"{RetroColors.CYAN}║{RetroColors.END} {RetroColors.TITLE}{title:^56}{RetroColors.END} {RetroColors.CYAN}║{RetroColors.END}")
@@ -142,7 +174,7 @@ def print_question(question: str):
     print(f"\n{RetroColors.PROMPT}🎮 {question}{RetroColors.END}")
     print(f"{RetroColors.DIM}   {'─' * (len(question) + 3)}{RetroColors.END}")
 
-def print_8bit_step(step_num: int, total_steps: int, title: str):
+def _print_8bit_step_retro(step_num: int, total_steps: int, title: str):
     """MEGA 8-bit step header with enhanced box drawing"""
     # Top border with corners
     print(f"\n{RetroColors.ARCADE}┌{'─' * 58}┐{RetroColors.END}")
@@ -151,7 +183,7 @@ def print_8bit_step(step_num: int, total_steps: int, title: str):
     # Bottom border with corners
     print(f"{RetroColors.ARCADE}└{'─' * 58}┘{RetroColors.END}")
 
-def print_8bit_box(title: str, content: str = ""):
+def _print_8bit_box_retro(title: str, content: str = ""):
     """MEGA 8-bit box with rounded corners"""
     print(f"\n{RetroColors.CYBER}╭{'─' * 58}╮{RetroColors.END}")
     print(f"{RetroColors.CYBER}│{RetroColors.END} {RetroColors.TITLE}{title:^56}{RetroColors.END} {RetroColors.CYBER}│{RetroColors.END}")
@@ -161,7 +193,7 @@ def print_8bit_box(title: str, content: str = ""):
             print(f"{RetroColors.CYBER}│{RetroColors.END} {line:<56} {RetroColors.CYBER}│{RetroColors.END}")
     print(f"{RetroColors.CYBER}╰{'─' * 58}╯{RetroColors.END}")
 
-def print_8bit_table(headers: list, rows: list):
+def _print_8bit_table_retro(headers: list, rows: list):
     """MEGA 8-bit table with box drawing"""
     # Calculate column widths
     col_widths = [len(str(h)) for h in headers]
@@ -190,6 +222,56 @@ def print_8bit_table(headers: list, rows: list):
     border = "└" + "┴".join("─" * (w + 2) for w in col_widths) + "┘"
     print(f"{RetroColors.ARCADE}{border}{RetroColors.END}")
 
+# Plain ASCII variants used when ANSI is off (redirected output, NO_COLOR):
+# no color fragments and no box-drawing characters to encode
+def _print_retro_header_plain(title: str):
+    """Plain-text header"""
+    print(f"\n+{'=' * 58}+\n| {title:^56} |\n+{'=' * 58}+")
+
+def _print_8bit_step_plain(step_num: int, total_steps: int, title: str):
+    """Plain-text step header"""
+    print(f"\n+{'-' * 58}+\n| STEP [{step_num}/{total_steps}] {title:^40} |\n+{'-' * 58}+")
+
+def _print_8bit_box_plain(title: str, content: str = ""):
+    """Plain-text box"""
+    rule = f"+{'-' * 58}+"
+    lines = ["", rule, f"| {title:^56} |"]
+    if content:
+        lines.append(rule)
+        lines.extend(f"| {line:<56} |" for line in content.split('\n'))
+    lines.append(rule)
+    print("\n".join(lines))
+
+def _print_8bit_table_plain(headers: list, rows: list):
+    """Plain-text table"""
+    col_widths = [len(str(h)) for h in headers]
+    for row in rows:
+        for i, cell in enumerate(row):
+            col_widths[i] = max(col_widths[i], len(str(cell)))
+    
+    rule = "+" + "+".join("-" * (w + 2) for w in col_widths) + "+"
+    lines = [rule, "|" + "|".join(f" {str(h):^{w}} " for h, w in zip(headers, col_widths)) + "|", rule]
+    for row in rows:
+        lines.append("|" + "|".join(f" {str(cell):^{w}} " for cell, w in zip(row, col_widths)) + "|")
+    lines.append(rule)
+    print("\n".join(lines))
+
+if ANSI_ENABLED:
+    print_retro_header = _print_retro_header_retro
+    print_8bit_step = _print_8bit_step_retro
+    print_8bit_box = _print_8bit_box_retro
+    print_8bit_table = _print_8bit_table_retro
+else:
+    print_retro_header = _print_retro_header_plain
+    print_8bit_step = _print_8bit_step_plain
+    print_8bit_box = _print_8bit_box_plain
+    print_8bit_table = _print_8bit_table_plain
+
+_YES = frozenset({'y', 'yes', 'evet', 'e'})
+_NO = frozenset({'n', 'no', 'hayır', 'h'})
+# Keep in step with _YES/_NO so every accepted answer is named
+_YES_NO_HINT = "Please enter y/yes/e/evet or n/no/h/hayır"
+
 def ask_yes_no(question: str, default: bool = True) -> bool:
     """Ask a yes/no question"""
     default_text = "Y/n" if default else "y/N"
@@ -197,11 +279,11 @@ def ask_yes_no(question: str, default: bool = True) -> bool:
         answer = input(f"{RetroColors.PROMPT}   {question} [{default_text}]: {RetroColors.END}").strip().lower()
         if not answer:
             return default
-        if answer in ['y', 'yes']:
+        if answer in _YES:
             return True
-        if answer in ['n', 'no']:
+        if answer in _NO:
             return False
-        print(f"{RetroColors.ERROR}   Please enter y/yes or n/no{RetroColors.END}")
+        print(f"{RetroColors.ERROR}   {_YES_NO_HINT}{RetroColors.END}")
 
 def ask_number(question: str, default: Optional[int] = None, min_val: Optional[int] = None, max_val: Optional[int] = None) -> int:
     """Prompt for an integer value"""
@@ -247,8 +329,12 @@ def interactive_setup() -> Dict[str, Any]:
     # Step 1: Input file
     print_8bit_step(1, 9, "INPUT FILE SELECTION")
     
-    # Detect available JSONL files
-    jsonl_files = glob.glob("*.jsonl")
+    # Detect available JSONL files; one directory scan, file type from the dir entry
+    with os.scandir() as entries:
+        jsonl_files = sorted(
+            e.name for e in entries
+            if e.name.endswith(".jsonl") and not e.name.startswith(".") and e.is_file()
+        )
     if jsonl_files:
         print(f"{RetroColors.INFO}Found JSONL files:{RetroColors.END}")
         for i, file in enumerate(jsonl_files, 1):
@@ -352,25 +438,17 @@ def interactive_setup() -> Dict[str, Any]:
         "min_params": min_params
     }
 
+@lru_cache(maxsize=256)
+def _split_labels(labels_str: str) -> Tuple[str, ...]:
+    """Split a generated label string; the same label sets recur across a dataset"""
+    return tuple(labels_str.split(', '))
+
 def run_processing(config: Dict[str, Any]):
     """Execute the processing pipeline"""
-    # Load dataset
-    records = load_jsonl(config["input_file"])
-    if not records:
-        print(f"{RetroColors.ERROR}No records found in input file{RetroColors.END}")
-        return
-    
-    print(f"{RetroColors.INFO}📂 Loaded {len(records)} records from {config['input_file']}{RetroColors.END}")
-    
-    # Batch processing
+    # Stream the dataset; batch processing just stops reading early
+    records = iter_jsonl(config["input_file"])
     if config["batch_size"]:
-        records = records[:config["batch_size"]]
-        print(f"{RetroColors.INFO}🔍 Processing first {len(records)} records{RetroColors.END}")
-    
-    print(f"{RetroColors.INFO}🔄 Processing with quality filter (min: {config['min_quality_score']}, max: {config['max_quality_score']})...{RetroColors.END}")
-    print(f"{RetroColors.CYBER}🎯 Activating 8-bit arcade mode...{RetroColors.END}")
-    print(f"{RetroColors.NEON}⚡ Powering up retro engines...{RetroColors.END}")
-    print()
+        records = islice(records, config["batch_size"])
     
     # Statistics
     stats = {
@@ -381,90 +459,152 @@ def run_processing(config: Dict[str, Any]):
         "high_score": 0,
         "errors": 0,
         "total_quality_score": 0.0,
-        "label_counts": {}
+        "label_counts": Counter()
     }
     
-    tools = []
+    # parameterize() resets its state on every call, so one instance serves the whole run
+    parameterizer = SQLParameterizer(
+        parameterize_tables=config["parameterize_tables"],
+        parameterize_columns=config["parameterize_columns"]
+    )
     
-    for idx, rec in enumerate(records):
-        # Show progress bar every 10 records
-        if idx % 10 == 0:
-            print_progress_bar(idx, len(records))
-        
-        try:
-            n = normalize(rec)
+    # Per-record output is collected here and handed to stdout in one write
+    # at each progress-bar refresh instead of one write per line
+    pending: List[str] = []
+    write = pending.append
+    error, end = RetroColors.ERROR, RetroColors.END
+    
+    def flush_pending():
+        if pending:
+            sys.stdout.write("".join(pending))
+            pending.clear()
+    
+    print(f"{RetroColors.INFO}📂 Reading records from {config['input_file']}{RetroColors.END}")
+    if config["batch_size"]:
+        print(f"{RetroColors.INFO}🔍 Processing first {config['batch_size']} records{RetroColors.END}")
+    
+    print(f"{RetroColors.INFO}🔄 Processing with quality filter (min: {config['min_quality_score']}, max: {config['max_quality_score']})...{RetroColors.END}")
+    print(f"{RetroColors.CYBER}🎯 Activating 8-bit arcade mode...{RetroColors.END}")
+    print(f"{RetroColors.NEON}⚡ Powering up retro engines...{RetroColors.END}")
+    print()
+    
+    # With a batch size the run has a known bound and gets a bar; otherwise a count
+    batch_size = config["batch_size"]
+    
+    def show_progress(current: int):
+        if batch_size:
+            print_progress_bar(current, batch_size)
+        else:
+            print_progress_count(current)
+    
+    # Outcome counters live in locals while looping and are written back to stats afterwards
+    success = quality_issues = low_score = high_score = empty_sql = errors = 0
+    total_seen = 0
+    total_quality_score = 0.0
+    label_counts = stats["label_counts"]
+    
+    # Accepted tools go straight to the output file instead of piling up in a dict
+    with YAMLToolStream(config["output_file"]) as tool_stream:
+        last_bar_t = 0.0
+        for idx, rec in enumerate(records):
+            total_seen += 1
+            # Refresh the progress display at most every 100ms, however fast records go by
+            now = time.monotonic()
+            if now - last_bar_t >= 0.1:
+                flush_pending()
+                show_progress(idx)
+                last_bar_t = now
             
-            # Empty SQL check
+            # Normalize as records are read; rows without SQL never reach the
+            # parameterize/validate steps and no raw record is kept
+            try:
+                n = normalize(rec)
+            except Exception as e:
+                errors += 1
+                write(f"{error}❌ Error processing record {idx}: {e}{end}\n")
+                continue
             if not n["sql"]:
-                stats["empty_sql"] += 1
+                empty_sql += 1
                 continue
+        
+            try:
+                # Parameterize SQL
+                parameterized_sql, params = parameterizer.parameterize(n["sql"])
             
-            # Parameterize SQL
-            parameterizer = SQLParameterizer(
-                parameterize_tables=config["parameterize_tables"],
-                parameterize_columns=config["parameterize_columns"]
-            )
-            parameterized_sql, params = parameterizer.parameterize(n["sql"])
+                # Minimum parameters check
+                if len(params) < config["min_params"]:
+                    low_score += 1
+                    continue
             
-            # Minimum parameters check
-            if len(params) < config["min_params"]:
-                stats["low_score"] += 1
-                continue
+                # Quality validation
+                is_valid, err_msg, quality_score = validate_tool_advanced(
+                    parameterized_sql, params, n["question"], min_score=config["min_quality_score"]
+                )
             
-            # Quality validation
-            is_valid, err_msg, quality_score = validate_tool_advanced(
-                parameterized_sql, params, n["question"], min_score=config["min_quality_score"]
-            )
+                if not is_valid:
+                    if "Quality score too low" in err_msg:
+                        low_score += 1
+                    else:
+                        quality_issues += 1
+                    continue
             
-            if not is_valid:
-                if "Quality score too low" in err_msg:
-                    stats["low_score"] += 1
-                else:
-                    stats["quality_issues"] += 1
-                continue
+                # Check max quality score
+                if quality_score > config["max_quality_score"]:
+                    high_score += 1
+                    continue
             
-            # Check max quality score
-            if quality_score > config["max_quality_score"]:
-                stats["high_score"] += 1
-                continue
-            
-            # Create tool with semantic description and labels
-            base_desc = generate_semantic_description(parameterized_sql, n["question"], params)
-            labels_str = generate_labels(n["sql"])  # Use original SQL for labels
-            desc = f"{base_desc} [Labels: {labels_str}]" if labels_str else base_desc
-            smart_name = generate_smart_tool_name(parameterized_sql, n["question"])
-            key = f"{smart_name}_{sha(n['sql'] + n['question'], n=4)}"
+                # Create tool with semantic description and labels
+                base_desc = generate_semantic_description(parameterized_sql, n["question"], params)
+                labels_str = generate_labels(n["sql"])  # Use original SQL for labels
+                desc = f"{base_desc} [Labels: {labels_str}]" if labels_str else base_desc
+                smart_name = generate_smart_tool_name(parameterized_sql, n["question"])
+                key = f"{smart_name}_{sha((n['sql'], n['question']), n=4)}"
             
-            tool = {
-                key: {
+                tool_stream.write(key, {
                     "kind": config["kind"],
                     "source": config["source_name"],
                     "statement": parameterized_sql,
                     "description": desc,
                     "templateParameters": params
-                }
-            }
+                })
+                success += 1
+                total_quality_score += quality_score
             
-            tools.append(tool)
-            stats["success"] += 1
-            stats["total_quality_score"] += quality_score
+                # Track labels
+                if labels_str:
+                    label_counts.update(_split_labels(labels_str))
             
-            # Track labels
-            if labels_str:
-                for label in labels_str.split(', '):
-                    stats["label_counts"][label] = stats["label_counts"].get(label, 0) + 1
+                # MEGA 8-bit progress styling
+                write(_RECORD_TMPL.format(
+                    n=success,
+                    key=key,
+                    desc=desc[:80] + '...' if len(desc) > 80 else desc,
+                    param_count=len(params),
+                    quality=quality_score,
+                ))
             
-            # MEGA 8-bit progress styling
-            print(f"{RetroColors.SUCCESS}🎮 [{stats['success']}] {key}{RetroColors.END}")
-            print(f"   {RetroColors.CYBER}📝 {desc[:80]}{'...' if len(desc) > 80 else ''}{RetroColors.END}")
-            print(f"   {RetroColors.ARCADE}🔧 {len(params)} parameters{RetroColors.END}")
-            print(f"   {RetroColors.NEON}⭐ Quality: {quality_score:.1f}/100{RetroColors.END}")
-            print(f"   {RetroColors.DIM}   {'─' * 60}{RetroColors.END}")
-            print()
-            
-        except Exception as e:
-            stats["errors"] += 1
-            print(f"{RetroColors.ERROR}❌ Error processing record {idx}: {e}{RetroColors.END}")
+            except Exception as e:
+                errors += 1
+                write(f"{error}❌ Error processing record {idx}: {e}{end}\n")
+    
+    stats.update(
+        success=success,
+        empty_sql=empty_sql,
+        quality_issues=quality_issues,
+        low_score=low_score,
+        high_score=high_score,
+        errors=errors,
+        total_quality_score=total_quality_score,
+    )
+    flush_pending()
+    if not total_seen:
+        print(f"\n{RetroColors.ERROR}No records found in input file{RetroColors.END}")
+        return
+    if batch_size:
+        print_progress_bar(total_seen, total_seen)
+    else:
+        print_progress_count(total_seen, done=True)
+    sys.stdout.flush()
     
     # MEGA 8-bit statistics with table
     print_8bit_box("🎮 PROCESSING STATISTICS", "")
@@ -482,7 +622,8 @@ def run_processing(config: Dict[str, Any]):
     
     print_8bit_table(["Metric", "Count", "Status"], stats_data[1:])
     
-    total_processed = sum(v for k, v in stats.items() if k not in ['total_quality_score', 'label_counts'])
+    total_processed = (stats["success"] + stats["empty_sql"] + stats["quality_issues"]
+                       + stats["low_score"] + stats["high_score"] + stats["errors"])
     
     # Summary box
     summary_content = f"Total Processed: {total_processed} records"
@@ -496,7 +637,7 @@ def run_processing(config: Dict[str, Any]):
     
     # MEGA 8-bit label statistics
     if stats.get('label_counts'):
-        sorted_labels = sorted(stats['label_counts'].items(), key=lambda x: x[1], reverse=True)
+        sorted_labels = stats['label_counts'].most_common()
         
         # Create label table
         label_data = []
@@ -507,18 +648,10 @@ def run_processing(config: Dict[str, Any]):
         print_8bit_table(["Label", "Count", "Percentage"], label_data)
     
     # Save output
-    if tools:
-        merge_yaml(config["output_file"], tools)
-        print(f"\n{RetroColors.SUCCESS}🎮 Wrote {len(tools)} tools to {config['output_file']}{RetroColors.END}")
+    if tool_stream.names:
+        print(f"\n{RetroColors.SUCCESS}🎮 Wrote {len(tool_stream.names)} tools to {config['output_file']}{RetroColors.END}")
         print(f"{RetroColors.CYBER}⚡ Tools saved with 8-bit precision!{RetroColors.END}")
-    
-    # Save remaining records
-    if config["batch_size"] and len(records) > config["batch_size"]:
-        remaining = records[config["batch_size"]:]
-        remaining_file = config["input_file"].replace('.jsonl', '_remaining.jsonl')
-        save_jsonl(remaining_file, remaining)
-        print(f"{RetroColors.INFO}🧹 Consumed {config['batch_size']} records from input{RetroColors.END}")
-        print(f"{RetroColors.INFO}📦 Remaining in input: {len(remaining)}{RetroColors.END}")
+
 
 def main():
     """Ana fonksiyon"""
@@ -6,33 +6,273 @@ With proper window controls and modern interface
 
 import sys
 import os
+import re
 import json
+import mmap
+import time
 import threading
-from typing import Dict, Any, List
+import traceback
+from array import array
+from collections import OrderedDict
+from functools import lru_cache, partial
+from typing import Dict, Any, List, Tuple
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QGridLayout, QLabel, QLineEdit, 
-                             QPushButton, QTextEdit, QProgressBar, QCheckBox,
+                             QPushButton, QTextEdit, QPlainTextEdit, QProgressBar, QCheckBox,
                              QSlider, QComboBox, QFileDialog, QMessageBox,
                              QTabWidget, QGroupBox, QSplitter, QFrame,
-                             QTableWidget, QTableWidgetItem, QHeaderView, QDialog, QMenu,
+                             QTableView, QAbstractItemView, QHeaderView, QDialog, QMenu,
                              QScrollArea, QInputDialog)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PyQt5.QtCore import (Qt, QThread, pyqtSignal, QTimer, QAbstractTableModel, QModelIndex,
+                          QSortFilterProxyModel)
 from PyQt5.QtGui import QFont, QPalette, QColor
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.io_operations import load_jsonl, merge_yaml
-from src.parameterizer import SQLParameterizer
-from src.quality import calculate_tool_quality_score
-from src.labels import generate_labels
+from src.io_operations import iter_jsonl, load_jsonl, YAMLToolStream, load_yaml_cached, jsonl_line_offsets
 from src.validation import validate_tool_advanced
-from src.export import (export_tools_to_json, export_tools_to_csv, 
+from src.processing import iter_processed
+from src.export import (export_tools_to_json, export_tools_to_csv, export_tools_to_yaml,
                         export_results_to_txt, export_results_to_json)
+from src.hf_importer import import_from_hf_dataset, normalize_hf_dataset, save_hf_dataset_to_jsonl
+
+TOOLTIP_LIMIT = 500  # Characters of a truncated cell shown in its tooltip
+
+# SQL features counted by the dataset analysis
+SQL_FEATURES = ('SELECT', 'WHERE', 'JOIN', 'GROUP BY', 'ORDER BY', 'HAVING', 'UNION', 'WITH')
+_SQL_FEATURE_INDEX = tuple(enumerate(SQL_FEATURES))
+# Features listed in the dataset information panel, with their labels
+_STATS_FEATURES = (('WHERE', 'WHERE clauses'), ('JOIN', 'JOIN operations'),
+                   ('GROUP BY', 'GROUP BY'), ('ORDER BY', 'ORDER BY'))
+
+# Processing preview banner and progress bar pieces, built once
+_PREVIEW_HEADER = """
+                   Welcome to ToolMint                        
+              SQL Tool Generation Platform                    
+
+
+Processing in Progress...
+
+"""
+_PROGRESS_BAR_WIDTH = 50
+_PROGRESS_BAR_FULL = "█" * _PROGRESS_BAR_WIDTH
+_PROGRESS_BAR_EMPTY = "░" * _PROGRESS_BAR_WIDTH
+_PREVIEW_STATS_TMPL = (
+    "Progress: %s/%s items processed (%d%%)\n"
+    "[%s%s]\n\n"
+    "Filtered: %s items\n"
+    "Elapsed: %ss | ETA: %s\n"
+)
+
+# Basic configuration fields: (config key, label, row, column[, row span, column span])
+_BASIC_FIELDS = (
+    ("output_file", "Output File:", 0, 0),
+    ("tool_name", "Tool Name:", 0, 2),
+    ("description", "Description:", 1, 0, 1, 3),
+    ("author", "Author:", 2, 0),
+    ("version", "Version:", 2, 2),
+    ("license", "License:", 3, 0),
+)
+
+def _truncate(value: str, limit: int) -> str:
+    """Shorten a cell value for table display"""
+    return value[:limit] + "..." if len(value) > limit else value
+
+@lru_cache(maxsize=None)
+def _bold_font(point_size: int) -> QFont:
+    """Shared bold title font; built on first use, once QApplication exists"""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(True)
+    return font
+
+@lru_cache(maxsize=None)
+def _mono_font() -> QFont:
+    """Shared monospace font for detail text"""
+    return QFont("Courier", 10)
+
+def _fit_columns(table: QTableView, caps: List[int], sample: int = 50):
+    """Size columns to the header and up to `sample` evenly spaced rows, each capped"""
+    model = table.model()
+    advance = table.fontMetrics().horizontalAdvance
+    sample_rows = range(0, model.rowCount(), max(1, model.rowCount() // sample))
+    for col, cap in enumerate(caps):
+        width = advance(str(model.headerData(col, Qt.Orientation.Horizontal)))
+        for row in sample_rows:
+            width = max(width, advance(model.index(row, col).data() or ""))
+        table.setColumnWidth(col, min(width + 20, cap))
+
+class ToolsTableModel(QAbstractTableModel):
+    """Table model over a tools mapping, display text held column by column"""
+    
+    COLUMNS = ['Tool Name', 'Description', 'SQL', 'Parameters', 'Quality Score', 'Labels']
+    SearchRole = Qt.ItemDataRole.UserRole + 1  # Row search text, for the filter proxy
+    # Truncated columns: field and display limit; longer values get the full text as a tooltip
+    TRUNCATED = {1: ('description', 80), 2: ('sql', 100), 5: ('labels', 50)}
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._display = [[] for _ in self.COLUMNS]
+        self.search_text = []
+        
+    def clear(self):
+        """Remove all rows in one reset"""
+        self.beginResetModel()
+        self._rows = []
+        self._display = [[] for _ in self.COLUMNS]
+        self.search_text = []
+        self.endResetModel()
+        
+    def append_tools(self, items: List[Tuple[str, Dict[str, Any]]]):
+        """Append (tool_name, tool_data) rows in one insert"""
+        if not items:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        self._rows.extend(items)
+        values = [t for _, t in items]
+        # Parallel per-field lists built in one pass each; data() then only indexes
+        names = [name for name, _ in items]
+        descs = [str(t.get('description', '')) for t in values]
+        sqls = [str(t.get('sql', '')) for t in values]
+        labels = [str(t.get('labels', '')) for t in values]
+        name_col, desc_col, sql_col, param_col, score_col, label_col = self._display
+        name_col.extend(names)
+        desc_col.extend(_truncate(d, 80) for d in descs)
+        sql_col.extend(_truncate(q, 100) for q in sqls)
+        param_col.extend(f"{len(p)} param(s)" if p else "No params" for p in (t.get('parameters', []) for t in values))
+        score_col.extend(str(t.get('quality_score', 0)) for t in values)
+        label_col.extend(_truncate(l, 50) for l in labels)
+        # Lowercased full text per row for the filter
+        self.search_text.extend(f"{n}\x00{d}\x00{q}\x00{l}".lower() for n, d, q, l in zip(names, descs, sqls, labels))
+        self.endInsertRows()
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section]
+        return super().headerData(section, orientation, role)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display[index.column()][index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._rows[index.row()]  # (tool_name, tool_data), shared by every column
+        if role == self.SearchRole:
+            return self.search_text[index.row()]
+        if role == Qt.ItemDataRole.ToolTipRole and index.column() in self.TRUNCATED:
+            field, limit = self.TRUNCATED[index.column()]
+            value = str(self._rows[index.row()][1].get(field, ''))
+            return _truncate(value, TOOLTIP_LIMIT) if len(value) > limit else None
+        return None
+
+class DatasetTableModel(QAbstractTableModel):
+    """Table model over a JSONL file, decoding records only when their rows are shown
+    
+    The file is memory-mapped and indexed by line offsets (cached across opens
+    by jsonl_line_offsets); decoded records are kept in a small LRU. Columns
+    are taken from the first record. Lines that cannot be a record are skipped
+    while indexing; one that still fails to decode shows as an empty row.
+    """
+    
+    CACHE_SIZE = 512
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._file = None
+        self._mm = None
+        self._starts = array('q')
+        self._ends = array('q')
+        self._cache = OrderedDict()
+        self._columns = []
+        
+    def load_file(self, path: str, offsets=None, file=None):
+        """Index the lines of a JSONL file, replacing the model contents in one reset
+        
+        offsets, when given, are the (starts, ends) already computed by jsonl_line_offsets;
+        file is an already-open binary handle on path, which the model takes over.
+        """
+        self.beginResetModel()
+        try:
+            self._close()
+            self._file = file if file is not None else open(path, 'rb')
+            self._starts, self._ends = offsets if offsets is not None else jsonl_line_offsets(path)
+            if self._starts:
+                self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._columns = list(self.record(0).keys()) if self._starts else []
+        finally:
+            self.endResetModel()
+            
+    def _close(self):
+        if self._mm is not None:
+            self._mm.close()
+        if self._file is not None:
+            self._file.close()
+        self._file = self._mm = None
+        self._starts, self._ends = array('q'), array('q')
+        self._cache.clear()
+        self._columns = []
+        
+    def release(self):
+        """Drop the file mapping and empty the model"""
+        self.beginResetModel()
+        self._close()
+        self.endResetModel()
+        
+    def record(self, row: int) -> Dict[str, Any]:
+        """Decoded record of a row, from the LRU when recently shown"""
+        cache = self._cache
+        rec = cache.get(row)
+        if rec is not None:
+            cache.move_to_end(row)
+            return rec
+        try:
+            rec = json.loads(self._mm[self._starts[row]:self._ends[row]])
+        except ValueError:
+            rec = {}
+        if not isinstance(rec, dict):
+            rec = {}
+        cache[row] = rec
+        if len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+        return rec
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._starts)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._columns[section]
+        return super().headerData(section, orientation, role)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = self.record(index.row()).get(self._columns[index.column()], "")
+            return _truncate(str(value), 100)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            value = str(self.record(index.row()).get(self._columns[index.column()], ""))
+            return _truncate(value, TOOLTIP_LIMIT) if len(value) > 100 else None
+        return None
 
 class ToolsViewerDialog(QDialog):
     """Dialog for viewing generated tools"""
     
+    POPULATE_CHUNK = 500  # Rows added per event-loop turn while loading
+    
     def __init__(self, file_path, parent=None):
         super().__init__(parent)
         self.file_path = file_path
@@ -47,10 +287,7 @@ class ToolsViewerDialog(QDialog):
         
         # Title
         title_label = QLabel(f"🛠️ Tools: {os.path.basename(self.file_path)}")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_bold_font(14))
         title_label.setStyleSheet("color: #2E86AB; padding: 10px;")
         layout.addWidget(title_label)
         
@@ -60,14 +297,35 @@ class ToolsViewerDialog(QDialog):
         self.filter_edit = QLineEdit()
         self.filter_edit.setPlaceholderText("Search by description, SQL, or labels...")
         self.filter_edit.textChanged.connect(self.filter_table)
+        
+        # Filter once typing pauses rather than on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        
+        # Rows are added a chunk per event-loop turn so the window stays responsive
+        self._populate_timer = QTimer(self)
+        self._populate_timer.setInterval(0)
+        self._populate_timer.timeout.connect(self._populate_chunk)
+        self._pending_rows = []
+        self._next_row = 0
         filter_layout.addWidget(self.filter_edit)
         layout.addLayout(filter_layout)
         
-        # Table widget
-        self.table = QTableWidget()
+        # Table view; filtering is done by the proxy in Qt, against each row's search text
+        self.model = ToolsTableModel(self)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setFilterRole(ToolsTableModel.SearchRole)
+        self.proxy.setFilterKeyColumn(0)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.itemDoubleClicked.connect(self.view_tool_details)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.table.doubleClicked.connect(self.view_tool_details)
         layout.addWidget(self.table)
         
         # Info label and buttons
@@ -89,9 +347,7 @@ class ToolsViewerDialog(QDialog):
     def load_tools(self):
         """Load and display tools from YAML file"""
         try:
-            import yaml
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = load_yaml_cached(self.file_path, sidecar=True)
             
             tools = {}
             if isinstance(data, dict):
@@ -101,97 +357,57 @@ class ToolsViewerDialog(QDialog):
                 self.info_label.setText("No tools found in file")
                 return
             
-            # Setup table
-            columns = ['Tool Name', 'Description', 'SQL', 'Parameters', 'Quality Score', 'Labels']
-            self.table.setRowCount(len(tools))
-            self.table.setColumnCount(len(columns))
-            self.table.setHorizontalHeaderLabels(columns)
+            self.model.clear()
+            self._pending_rows = list(tools.items())
+            self._next_row = 0
+            # First chunk right away so there is something to show and to size columns from
+            self._populate_chunk()
             
-            # Populate table
-            for row_idx, (tool_name, tool_data) in enumerate(tools.items()):
-                # Tool Name
-                self.table.setItem(row_idx, 0, QTableWidgetItem(tool_name))
-                
-                # Description
-                desc = str(tool_data.get('description', ''))
-                if len(desc) > 80:
-                    desc = desc[:80] + "..."
-                self.table.setItem(row_idx, 1, QTableWidgetItem(desc))
-                
-                # SQL
-                sql = str(tool_data.get('sql', ''))
-                if len(sql) > 100:
-                    sql = sql[:100] + "..."
-                self.table.setItem(row_idx, 2, QTableWidgetItem(sql))
-                
-                # Parameters
-                params = tool_data.get('parameters', [])
-                param_str = f"{len(params)} param(s)" if params else "No params"
-                self.table.setItem(row_idx, 3, QTableWidgetItem(param_str))
-                
-                # Quality Score
-                score = tool_data.get('quality_score', 0)
-                self.table.setItem(row_idx, 4, QTableWidgetItem(str(score)))
-                
-                # Labels
-                labels = str(tool_data.get('labels', ''))
-                if len(labels) > 50:
-                    labels = labels[:50] + "..."
-                self.table.setItem(row_idx, 5, QTableWidgetItem(labels))
-                
-                # Store full data for details view
-                for col_idx in range(6):
-                    item = self.table.item(row_idx, col_idx)
-                    if item:
-                        item.setData(Qt.ItemDataRole.UserRole, {tool_name: tool_data})
-            
-            # Resize columns
-            self.table.resizeColumnsToContents()
-            self.table.setColumnWidth(1, 300)  # Description
-            self.table.setColumnWidth(2, 350)  # SQL
-            self.table.setColumnWidth(3, 120)  # Parameters
-            self.table.setColumnWidth(4, 100)  # Quality Score
-            self.table.setColumnWidth(5, 150)  # Labels
-            
-            # Update info
-            self.info_label.setText(f"Loaded {len(tools)} tools")
+            # Widths from a sample of rows: Name, Description, SQL, Parameters, Quality Score, Labels
+            _fit_columns(self.table, [300, 300, 350, 120, 100, 150])
             
         except Exception as e:
             self.info_label.setText(f"Error loading tools: {str(e)}")
             
+    def _populate_chunk(self):
+        """Add the next chunk of pending rows, rescheduling until all are in"""
+        end = self._next_row + self.POPULATE_CHUNK
+        self.model.append_tools(self._pending_rows[self._next_row:end])
+        self._next_row = min(end, len(self._pending_rows))
+        total = len(self._pending_rows)
+        if self._next_row < total:
+            self.info_label.setText(f"Loading tools... {self._next_row}/{total}")
+            self._populate_timer.start()
+        else:
+            self._populate_timer.stop()
+            self._pending_rows = []
+            self.info_label.setText(f"Loaded {total} tools")
+            
     def filter_table(self, text):
+        """Schedule filtering for when typing pauses"""
+        self._filter_timer.start()
+        
+    def _apply_filter(self):
         """Filter table by search text"""
-        for row in range(self.table.rowCount()):
-            match = False
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item and text.lower() in item.text().lower():
-                    match = True
-                    break
-            self.table.setRowHidden(row, not match)
+        self.proxy.setFilterFixedString(self.filter_edit.text())
             
     def view_selected_tool_details(self):
         """View details of selected tool"""
-        selected_items = self.table.selectedItems()
-        if not selected_items:
+        selected_rows = self.table.selectionModel().selectedRows()
+        if not selected_rows:
             QMessageBox.information(self, "No Selection", "Please select a tool to view details")
             return
         
         # Get the first selected row
-        row = selected_items[0].row()
-        item = self.table.item(row, 0)
-        if item:
-            tool_data = item.data(Qt.ItemDataRole.UserRole)
-            self.view_tool_details(item)
+        self.view_tool_details(selected_rows[0])
             
-    def view_tool_details(self, item):
+    def view_tool_details(self, index):
         """View detailed information about a tool"""
-        tool_data = item.data(Qt.ItemDataRole.UserRole)
-        if not tool_data:
+        row = index.data(Qt.ItemDataRole.UserRole)
+        if not row:
             return
             
-        tool_name = list(tool_data.keys())[0]
-        tool_info = tool_data[tool_name]
+        tool_name, tool_info = row
         
         # Create detail dialog
         detail_dialog = QDialog(self)
@@ -202,10 +418,7 @@ class ToolsViewerDialog(QDialog):
         
         # Title
         title = QLabel(f"🛠️ {tool_name}")
-        title_font = QFont()
-        title_font.setBold(True)
-        title_font.setPointSize(12)
-        title.setFont(title_font)
+        title.setFont(_bold_font(12))
         layout.addWidget(title)
         
         # Scrollable text area for details
@@ -213,60 +426,76 @@ class ToolsViewerDialog(QDialog):
         detail_text.setReadOnly(True)
         
         details = f"""Description:
-{self._safe_get(tool_info, 'description', 'N/A')}
+{tool_info.get('description', 'N/A')}
 
 SQL Query:
-{self._safe_get(tool_info, 'sql', 'N/A')}
+{tool_info.get('sql', 'N/A')}
 
-Quality Score: {self._safe_get(tool_info, 'quality_score', 'N/A')}
-Labels: {self._safe_get(tool_info, 'labels', 'N/A')}
-Database ID: {self._safe_get(tool_info, 'db_id', 'N/A')}
-Source: {self._safe_get(tool_info, 'source', 'N/A')}
+Quality Score: {tool_info.get('quality_score', 'N/A')}
+Labels: {tool_info.get('labels', 'N/A')}
+Database ID: {tool_info.get('db_id', 'N/A')}
+Source: {tool_info.get('source', 'N/A')}
 
 Parameters:
 {self._format_parameters(tool_info.get('parameters', []))}
 """
         
         detail_text.setPlainText(details)
-        detail_text.setFont(QFont("Courier", 10))
+        detail_text.setFont(_mono_font())
         layout.addWidget(detail_text)
         
         # Close button
         close_btn = QPushButton("Close")
-        close_btn.clicked.connect(lambda: detail_dialog.accept())
+        close_btn.clicked.connect(detail_dialog.accept)
         layout.addWidget(close_btn)
         
         detail_dialog.exec_()
         
-    def _safe_get(self, data, key, default):
-        """Safely get value from dictionary"""
-        return str(data.get(key, default))
-        
     def _format_parameters(self, params):
         """Format parameters list for display"""
         if not params:
             return "No parameters"
         
-        result = []
-        for p in params:
-            param_str = f"  - {p.get('name', 'N/A')} ({p.get('type', 'N/A')})"
-            desc = p.get('description', '')
-            if desc:
-                param_str += f": {desc}"
-            result.append(param_str)
-        
-        return "\n".join(result)
+        return "\n".join(
+            f"  - {p.get('name', 'N/A')} ({p.get('type', 'N/A')})"
+            + (f": {p['description']}" if p.get('description') else "")
+            for p in params
+        )
         
     def close_dialog(self):
         """Close the dialog"""
         self.accept()
+        
+    def done(self, result):
+        """Stop loading rows however the dialog is closed"""
+        self._populate_timer.stop()
+        self._pending_rows = []
+        super().done(result)
+
+class DatasetIndexWorker(QThread):
+    """Worker thread that indexes JSONL line offsets so large files don't block the dialog"""
+    indexed = pyqtSignal(object)  # (starts, ends)
+    error = pyqtSignal(str)
+    
+    def __init__(self, file_path, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        
+    def run(self):
+        try:
+            offsets = jsonl_line_offsets(self.file_path, self.isInterruptionRequested)
+            if offsets is not None:
+                self.indexed.emit(offsets)
+        except Exception as e:
+            self.error.emit(str(e))
 
 class DatasetViewerDialog(QDialog):
     """Dialog for viewing dataset contents"""
     
-    def __init__(self, file_path, parent=None):
+    def __init__(self, file_path, parent=None, file=None):
         super().__init__(parent)
         self.file_path = file_path
+        self._file = file  # Open handle passed on to the model once indexed
         self.setWindowTitle(f"Dataset Viewer - {os.path.basename(file_path)}")
         self.setGeometry(100, 100, 1200, 700)
         self.setup_ui()
@@ -278,16 +507,16 @@ class DatasetViewerDialog(QDialog):
         
         # Title
         title_label = QLabel(f"📊 Viewing: {os.path.basename(self.file_path)}")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_bold_font(14))
         title_label.setStyleSheet("color: #2E86AB; padding: 10px;")
         layout.addWidget(title_label)
         
-        # Table widget
-        self.table = QTableWidget()
+        # Table view
+        self.model = DatasetTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setAlternatingRowColors(True)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         layout.addWidget(self.table)
         
         # Info label
@@ -303,48 +532,92 @@ class DatasetViewerDialog(QDialog):
         """Close the dialog"""
         self.accept()
         
+    def done(self, result):
+        """Release the dataset file however the dialog is closed"""
+        # done() can run more than once; the worker is stopped only the first time
+        worker, self.index_worker = self.index_worker, None
+        if worker is not None:
+            worker.indexed.disconnect()
+            worker.error.disconnect()
+            worker.requestInterruption()  # The scan stops within a few thousand lines
+            worker.wait()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.model.release()
+        super().done(result)
+        
     def load_dataset(self):
+        """Index the dataset in a worker thread; the table fills in when it's done"""
+        self.index_worker = DatasetIndexWorker(self.file_path, self)
+        self.index_worker.indexed.connect(self.show_dataset)
+        self.index_worker.error.connect(lambda e: self.info_label.setText(f"Error loading dataset: {e}"))
+        self.index_worker.start()
+        
+    def show_dataset(self, offsets):
         """Load and display dataset"""
         try:
-            from src.io_operations import load_jsonl
-            data = load_jsonl(self.file_path)
+            file, self._file = self._file, None
+            self.model.load_file(self.file_path, offsets, file)
+            records = self.model.rowCount()
             
-            if not data:
+            if not records:
                 self.info_label.setText("Dataset is empty")
                 return
             
-            # Get first item keys to determine columns
-            first_item = data[0]
-            columns = list(first_item.keys())
-            
-            # Setup table
-            self.table.setRowCount(len(data))
-            self.table.setColumnCount(len(columns))
-            self.table.setHorizontalHeaderLabels(columns)
-            
-            # Populate table
-            for row_idx, item in enumerate(data):
-                for col_idx, col_name in enumerate(columns):
-                    value = str(item.get(col_name, ""))
-                    # Truncate long values
-                    if len(value) > 100:
-                        value = value[:100] + "..."
-                    self.table.setItem(row_idx, col_idx, QTableWidgetItem(value))
-            
-            # Resize columns to content
-            self.table.resizeColumnsToContents()
-            
-            # Adjust column widths for readability
-            for col in range(len(columns)):
-                width = self.table.columnWidth(col)
-                self.table.setColumnWidth(col, min(width, 300))
+            _fit_columns(self.table, [300] * self.model.columnCount())
             
             # Update info
-            self.info_label.setText(f"Loaded {len(data)} records with {len(columns)} columns")
+            self.info_label.setText(f"Loaded {records} records with {self.model.columnCount()} columns")
             
         except Exception as e:
             self.info_label.setText(f"Error loading dataset: {str(e)}")
 
+class DatasetAnalysisWorker(QThread):
+    """Worker thread that streams a dataset once and counts SQL statistics"""
+    analyzed = pyqtSignal(dict)
+    missing = pyqtSignal()  # Path does not exist (yet)
+    error = pyqtSignal(str)
+    
+    def __init__(self, file_path, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        
+    def run(self):
+        try:
+            # Stream the dataset, keeping only counters in memory
+            total_records = 0
+            
+            # SQL feature analysis: one upper() per query, then C-level substring checks
+            # (measured faster than a single alternation regex or bytes scans)
+            feature_counts = [0] * len(SQL_FEATURES)
+            total_sql_length = 0
+            valid_sql_count = 0
+            
+            for item in iter_jsonl(self.file_path):
+                total_records += 1
+                if not total_records & 1023 and self.isInterruptionRequested():
+                    return
+                sql = item.get('sql', '')
+                if sql:
+                    valid_sql_count += 1
+                    total_sql_length += len(sql)
+                    sql_upper = sql.upper()
+                    for idx, keyword in _SQL_FEATURE_INDEX:
+                        if keyword in sql_upper:
+                            feature_counts[idx] += 1
+            
+            self.analyzed.emit({
+                'total_records': total_records,
+                'valid_sql_count': valid_sql_count,
+                'total_sql_length': total_sql_length,
+                'sql_keywords': dict(zip(SQL_FEATURES, feature_counts))
+            })
+        except FileNotFoundError:
+            self.missing.emit()
+        except Exception as e:
+            self.error.emit(str(e))
+
 class ProcessingWorker(QThread):
     """Worker thread for processing data"""
     progress = pyqtSignal(int)
@@ -359,150 +632,115 @@ class ProcessingWorker(QThread):
         
     def run(self):
         try:
-            import time
             self.status.emit("Loading data...")
             self.progress.emit(10)
             
             # Load data
             data = load_jsonl(self.config["input_file"])
-            self.status.emit(f"Loaded {len(data)} items")
+            total = len(data)
+            self.status.emit(f"Loaded {total} items")
             self.progress.emit(30)
             
             # Process data
             self.status.emit("Processing data...")
             self.progress.emit(50)
             
-            # Real processing using existing modules
-            from src.parameterizer import SQLParameterizer
-            from src.quality import calculate_tool_quality_score
-            from src.labels import generate_labels
-            from src.validation import validate_tool_advanced
+            # Tools are written to the output as they are made; existing tools
+            # in the file are kept and same-named ones replaced, like merge_yaml
+            output_file = self.config.get("output_file", "tools.yaml")
+            dialect = self.config.get("sql_dialect", "mysql")
             
-            # Initialize parameterizer
-            param = SQLParameterizer(
-                parameterize_tables=self.config.get("parameterize_tables", True),
-                parameterize_columns=self.config.get("parameterize_columns", True),
-                min_params=self.config.get("min_params", 1)
-            )
+            # Adjust output file name based on dialect
+            if dialect != "mysql":
+                base, ext = os.path.splitext(output_file)
+                output_file = f"{base}_{dialect}{ext}"
             
-            # Process each item
-            tools = []
+            # Process each item; large inputs are spread over a process pool,
+            # results still arrive in input order
             processed_count = 0
             filtered_count = 0
+            last_progress = -1
+            err_count = 0
+            err_samples = []  # (index, message) of the first few failures
+            score_err_count = 0  # Tools kept with the default quality score
             start_time = time.time()
+            last_stats_time = 0.0
             
-            for i, item in enumerate(data):
-                try:
-                    # Normalize the item
-                    from src.io_operations import normalize
-                    normalized = normalize(item)
-                    
-                    if not normalized.get("sql") or not normalized.get("question"):
-                        continue
-                    
-                    # Generate parameterized SQL
-                    if self.config.get("use_parameterization", True):
-                        param_sql, params = param.parameterize(normalized["sql"])
-                    else:
-                        param_sql = normalized["sql"]
-                        params = []
-                    
-                    # Convert to target SQL dialect
-                    dialect = self.config.get("sql_dialect", "mysql")
-                    if dialect != "mysql":
-                        from src.sql_dialect_converter import SQLDialectConverter
-                        converter = SQLDialectConverter(dialect)
-                        param_sql, params = converter.convert(param_sql, params)
-                    
-                    # Calculate quality score (simplified for now)
+            with YAMLToolStream(output_file) as tool_stream:
+                for i, (fields, error) in enumerate(iter_processed(data, self.config)):
                     try:
-                        if self.config.get("use_quality_scoring", True):
-                            quality_score, _ = calculate_tool_quality_score(
-                                param_sql, 
-                                params, 
-                                normalized["question"]
-                            )
-                        else:
-                            quality_score = 100
-                    except Exception as e:
-                        print(f"Quality score error: {e}")
-                        quality_score = 50  # Default score
-                    
-                    # Generate labels
-                    if self.config.get("use_labeling", True):
-                        labels = generate_labels(param_sql)
-                    else:
-                        labels = ""
-                    
-                    # Create tool
-                    tool_name = f"sql_tool_{processed_count + 1}"
-                    tool = {
-                        tool_name: {
-                            "description": normalized["question"],
-                            "sql": param_sql,
-                            "parameters": params,
-                            "quality_score": quality_score,
-                            "labels": labels,
-                            "db_id": normalized.get("db_id", ""),
-                            "source": normalized.get("source", "unknown")
-                        }
-                    }
-                    
-                    tools.append(tool)
-                    processed_count += 1
-                    
-                    # Update progress
-                    progress = 50 + int((i / len(data)) * 40)
-                    self.progress.emit(progress)
-                    
-                    # Emit stats every 100 items or every 10 items after first 100
-                    if i % 10 == 0 or (processed_count > 100 and i % 100 == 0):
-                        elapsed = time.time() - start_time
-                        remaining_items = len(data) - (i + 1)
+                        if fields is None:
+                            if error is not None:
+                                err_count += 1
+                                if len(err_samples) < 10:
+                                    err_samples.append((i, error))
+                            continue
+                        if error is not None:
+                            score_err_count += 1
                         
-                        # Calculate ETA (only after processing > 10 items)
-                        if processed_count > 10:
-                            avg_time_per_item = elapsed / processed_count
-                            eta_seconds = avg_time_per_item * remaining_items
-                            eta_minutes = int(eta_seconds // 60)
-                            eta_seconds = int(eta_seconds % 60)
-                            eta_str = f"{eta_minutes}m {eta_seconds}s"
-                        else:
-                            eta_str = "Calculating..."
+                        # Create tool
+                        tool_name = f"sql_tool_{processed_count + 1}"
+                        tool_stream.write(tool_name, fields)
+                        processed_count += 1
                         
-                        stats = {
-                            'processed': processed_count,
-                            'total': len(data),
-                            'filtered': filtered_count,
-                            'eta': eta_str,
-                            'elapsed': f"{int(elapsed)}s"
-                        }
-                        self.stats.emit(stats)
-                    
-                except Exception as e:
-                    print(f"Error processing item {i}: {e}")
-                    continue
-            
-            # Save to YAML file with dialect-specific naming
-            self.status.emit("Saving results...")
-            output_file = self.config.get("output_file", "tools.yaml")
-            dialect = self.config.get("sql_dialect", "mysql")
-            
-            # Adjust output file name based on dialect
-            if dialect != "mysql":
-                base, ext = os.path.splitext(output_file)
-                output_file = f"{base}_{dialect}{ext}"
-            
-            merge_yaml(output_file, tools)
+                        # Update progress; only a changed value crosses the thread boundary
+                        progress = 50 + int((i / total) * 40)
+                        if progress != last_progress:
+                            self.progress.emit(progress)
+                            last_progress = progress
+                        
+                        # Emit stats at most 4 times a second, however fast items arrive
+                        now = time.time()
+                        if now - last_stats_time >= 0.25:
+                            last_stats_time = now
+                            elapsed = now - start_time
+                            remaining_items = total - (i + 1)
+                            
+                            # Calculate ETA (only after processing > 10 items)
+                            if processed_count > 10:
+                                avg_time_per_item = elapsed / processed_count
+                                eta_seconds = avg_time_per_item * remaining_items
+                                eta_minutes = int(eta_seconds // 60)
+                                eta_seconds = int(eta_seconds % 60)
+                                eta_str = f"{eta_minutes}m {eta_seconds}s"
+                            else:
+                                eta_str = "Calculating..."
+                            
+                            stats = {
+                                'processed': processed_count,
+                                'total': total,
+                                'filtered': filtered_count,
+                                'eta': eta_str,
+                                'elapsed': f"{int(elapsed)}s"
+                            }
+                            self.stats.emit(stats)
+                        
+                    except Exception as e:
+                        err_count += 1
+                        if len(err_samples) < 10:
+                            err_samples.append((i, repr(e)))
+                        continue
             
             self.progress.emit(100)
-            self.status.emit(f"Processing completed! Saved to {output_file}")
+            if processed_count:
+                done_msg = f"Processing completed! Saved to {output_file}"
+            else:
+                done_msg = f"Processing completed - no tools created, {output_file} left unchanged"
+            # Failures go in the final status and the results, so they stay visible
+            if err_count:
+                done_msg += f" ({err_count} items failed)"
+            if score_err_count:
+                done_msg += f" ({score_err_count} tools kept the default quality score)"
+            self.status.emit(done_msg)
             
             # Return results
             results = {
                 "input_file": self.config["input_file"],
-                "items_processed": len(data),
+                "items_processed": total,
                 "tools_created": processed_count,
+                "failed": err_count,
+                "failed_samples": [f"item {i}: {msg}" for i, msg in err_samples],
+                "score_errors": score_err_count,
                 "output_file": output_file,
                 "processing_time": "Real processing completed"
             }
@@ -510,14 +748,193 @@ class ProcessingWorker(QThread):
             self.finished.emit(results)
             
         except Exception as e:
-            import traceback
             error_msg = f"Processing Error:\n{str(e)}\n\nTraceback:\n{traceback.format_exc()}"
             print(error_msg)  # Mirror the message in the console
             self.error.emit(error_msg)
 
+# Application stylesheet, parsed once when the main window applies it.
+# Buttons with their own look are matched by object name.
+_APP_QSS = """
+    QMainWindow {
+        background-color: #f5f5f5;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #cccccc;
+        border-radius: 8px;
+        margin-top: 1ex;
+        padding-top: 10px;
+        background-color: white;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        color: #2E86AB;
+    }
+    QPushButton {
+        background-color: #4CAF50;
+        border: none;
+        color: white;
+        padding: 8px 16px;
+        text-align: center;
+        font-size: 14px;
+        border-radius: 4px;
+        min-width: 100px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:pressed {
+        background-color: #3d8b40;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+    QLineEdit, QTextEdit, QPlainTextEdit, QComboBox {
+        border: 2px solid #ddd;
+        border-radius: 4px;
+        padding: 5px;
+        font-size: 12px;
+        background-color: white;
+        color: #333;
+    }
+    QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus, QComboBox:focus {
+        border-color: #4CAF50;
+    }
+    QProgressBar {
+        border: 2px solid #ddd;
+        border-radius: 4px;
+        text-align: center;
+        background-color: #f0f0f0;
+    }
+    QProgressBar::chunk {
+        background-color: #4CAF50;
+        border-radius: 2px;
+    }
+    QLabel {
+        color: #333;
+    }
+    QCheckBox {
+        color: #333;
+        spacing: 10px;
+        font-size: 14px;
+        font-weight: 600;
+        padding: 4px;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border: 2px solid #888;
+        border-radius: 3px;
+        background-color: white;
+    }
+    QCheckBox::indicator:hover {
+        border-color: #4CAF50;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #4CAF50;
+        border-color: #4CAF50;
+    }
+    QCheckBox::indicator:checked:hover {
+        background-color: #45a049;
+        border-color: #45a049;
+    }
+    QToolTip {
+        background-color: #e0e0e0;
+        color: black;
+        border: 1px solid #999;
+        border-radius: 4px;
+        padding: 8px;
+        font-size: 12px;
+        font-weight: 500;
+    }
+    QMessageBox {
+        background-color: white;
+        color: #333;
+        font-size: 13px;
+    }
+    QMessageBox QLabel {
+        color: #333;
+        background-color: white;
+        padding: 10px;
+    }
+    QMessageBox QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 8px 20px;
+        border-radius: 4px;
+        font-weight: bold;
+        min-width: 80px;
+    }
+    QMessageBox QPushButton:hover {
+        background-color: #45a049;
+    }
+    QMessageBox QPushButton:pressed {
+        background-color: #3d8b40;
+    }
+    QScrollArea#configScroll {
+        border: none;
+        background-color: #f5f5f5;
+    }
+    QWidget#configPanel, QWidget#configPanel * {
+        background-color: #f5f5f5;
+    }
+    QPushButton#browseButton {
+        background-color: #4CAF50;
+        color: white;
+        font-weight: bold;
+        padding: 6px 12px;
+    }
+    QPushButton#browseButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton#hfButton {
+        background-color: #FF6B6B;
+        color: white;
+        font-weight: bold;
+        padding: 6px 12px;
+    }
+    QPushButton#hfButton:hover {
+        background-color: #FF5252;
+        color: black;
+    }
+    QPushButton#viewDatasetButton {
+        background-color: #2196F3;
+        color: white;
+        font-weight: bold;
+        padding: 6px 12px;
+    }
+    QPushButton#viewDatasetButton:hover {
+        background-color: #1976D2;
+        color: black;
+    }
+    QPushButton#startButton {
+        background-color: #2196F3;
+        font-size: 16px;
+        padding: 12px 24px;
+        min-height: 20px;
+    }
+    QPushButton#startButton:hover {
+        background-color: #1976D2;
+    }
+    QPushButton#viewToolsButton { background-color: #FF9800; }
+    QLabel#optionHelp, QLabel#dialectInfo, QLabel#qualityHelp {
+        color: #666;
+        font-size: 11px;
+    }
+    QLabel#optionHelp { margin-left: 30px; }
+    QLabel#dialectInfo { margin-left: 10px; }
+    QLabel#qualityHelp { margin-left: 5px; }
+"""
+
 class ModernSQLToolGenerator(QMainWindow):
     """Modern PyQt5 GUI application"""
     
+    ANALYSIS_CACHE_SIZE = 16  # Dataset analyses kept for reselected files
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("ToolMint")
@@ -553,136 +970,28 @@ class ModernSQLToolGenerator(QMainWindow):
         }
         
         self.processing = False
+        self.worker = None
         self.results = {}
         self.processing_stats = {}  # Store processing statistics
+        self._results_dirty = False  # Results summary not yet rendered
+        self._results_text_cache = ""  # Text currently shown in the results view
+        self._cwd = os.getcwd()  # Relative output paths resolve against this
+        self._output_path = ""  # Absolute path of the last run's output file
+        self._analyze_worker = None  # Dataset analysis in progress
+        self._analysis_cache = OrderedDict()  # (path, mtime_ns, size) -> stats, most recent last
+        
+        # Coalesce bursts of stats signals into at most one preview redraw per interval
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(200)
+        self._preview_timer.timeout.connect(self.update_processing_preview)
         
         # Create UI
         self.create_ui()
         
     def setup_style(self):
         """Setup modern styling"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 8px;
-                margin-top: 1ex;
-                padding-top: 10px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #2E86AB;
-            }
-            QPushButton {
-                background-color: #4CAF50;
-                border: none;
-                color: white;
-                padding: 8px 16px;
-                text-align: center;
-                font-size: 14px;
-                border-radius: 4px;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-            QLineEdit, QTextEdit, QComboBox {
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                padding: 5px;
-                font-size: 12px;
-                background-color: white;
-                color: #333;
-            }
-            QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
-                border-color: #4CAF50;
-            }
-            QProgressBar {
-                border: 2px solid #ddd;
-                border-radius: 4px;
-                text-align: center;
-                background-color: #f0f0f0;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                border-radius: 2px;
-            }
-            QLabel {
-                color: #333;
-            }
-            QCheckBox {
-                color: #333;
-                spacing: 10px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 4px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 2px solid #888;
-                border-radius: 3px;
-                background-color: white;
-            }
-            QCheckBox::indicator:hover {
-                border-color: #4CAF50;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #4CAF50;
-                border-color: #4CAF50;
-            }
-            QCheckBox::indicator:checked:hover {
-                background-color: #45a049;
-                border-color: #45a049;
-            }
-            QToolTip {
-                background-color: #e0e0e0;
-                color: black;
-                border: 1px solid #999;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 12px;
-                font-weight: 500;
-            }
-            QMessageBox {
-                background-color: white;
-                color: #333;
-                font-size: 13px;
-            }
-            QMessageBox QLabel {
-                color: #333;
-                background-color: white;
-                padding: 10px;
-            }
-            QMessageBox QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 4px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #45a049;
-            }
-            QMessageBox QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
+        self.setStyleSheet(_APP_QSS)
         
     def create_ui(self):
         """Create the main UI"""
@@ -708,13 +1017,8 @@ class ModernSQLToolGenerator(QMainWindow):
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         
-        # Set light gray background to match main window
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: #f5f5f5;
-            }
-        """)
+        # Light gray background to match main window (see _APP_QSS)
+        scroll_area.setObjectName("configScroll")
         
         splitter.addWidget(scroll_area)
         
@@ -739,7 +1043,7 @@ class ModernSQLToolGenerator(QMainWindow):
         """Create configuration panel"""
         panel = QWidget()
         panel.setMinimumWidth(500)  # Set minimum width to prevent squeezing
-        panel.setStyleSheet("background-color: #f5f5f5;")  # Match main background
+        panel.setObjectName("configPanel")  # Gray background from _APP_QSS to match main window
         layout = QVBoxLayout(panel)
         layout.setSpacing(15)
         layout.setContentsMargins(10, 10, 10, 10)  # Add some margins
@@ -760,53 +1064,21 @@ class ModernSQLToolGenerator(QMainWindow):
         
         browse_btn = QPushButton("Browse")
         browse_btn.clicked.connect(self.browse_file)
-        browse_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-weight: bold;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        browse_btn.setObjectName("browseButton")
         file_layout.addWidget(browse_btn, 0, 2)
         
         # Hugging Face Import button
         hf_btn = QPushButton("🤗 HF")
         hf_btn.clicked.connect(self.import_from_hf)
         hf_btn.setToolTip("Import dataset from Hugging Face Hub")
-        hf_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF6B6B;
-                color: white;
-                font-weight: bold;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #FF5252;
-                color: black;
-            }
-        """)
+        hf_btn.setObjectName("hfButton")
         file_layout.addWidget(hf_btn, 0, 3)
         
         # View dataset button
         view_dataset_btn = QPushButton("👁️ View")
         view_dataset_btn.clicked.connect(self.view_dataset)
         view_dataset_btn.setToolTip("View dataset contents in a table")
-        view_dataset_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                font-weight: bold;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-                color: black;
-            }
-        """)
+        view_dataset_btn.setObjectName("viewDatasetButton")
         file_layout.addWidget(view_dataset_btn, 0, 4)
         
         layout.addWidget(file_group)
@@ -821,40 +1093,23 @@ class ModernSQLToolGenerator(QMainWindow):
         self.dataset_info_group.setVisible(False)
         layout.addWidget(self.dataset_info_group)
         
-        # Connect file path changes to analyze dataset
-        self.file_path_edit.textChanged.connect(self.analyze_dataset)
+        # Analyze the dataset once the path stops changing, not on every keystroke
+        self._analyze_timer = QTimer(self)
+        self._analyze_timer.setSingleShot(True)
+        self._analyze_timer.setInterval(300)
+        self._analyze_timer.timeout.connect(self.analyze_dataset)
+        self.file_path_edit.textChanged.connect(self._analyze_timer.start)
         
         # Basic Configuration Group
         basic_group = QGroupBox("⚙️ Basic Configuration")
         basic_layout = QGridLayout(basic_group)
         
-        # Output file
-        basic_layout.addWidget(QLabel("Output File:"), 0, 0)
-        self.output_file_edit = QLineEdit(self.config["output_file"])
-        basic_layout.addWidget(self.output_file_edit, 0, 1)
-        
-        # Tool name
-        basic_layout.addWidget(QLabel("Tool Name:"), 0, 2)
-        self.tool_name_edit = QLineEdit(self.config["tool_name"])
-        basic_layout.addWidget(self.tool_name_edit, 0, 3)
-        
-        # Description
-        basic_layout.addWidget(QLabel("Description:"), 1, 0)
-        self.description_edit = QLineEdit(self.config["description"])
-        basic_layout.addWidget(self.description_edit, 1, 1, 1, 3)
-        
-        # Author, Version, License
-        basic_layout.addWidget(QLabel("Author:"), 2, 0)
-        self.author_edit = QLineEdit(self.config["author"])
-        basic_layout.addWidget(self.author_edit, 2, 1)
-        
-        basic_layout.addWidget(QLabel("Version:"), 2, 2)
-        self.version_edit = QLineEdit(self.config["version"])
-        basic_layout.addWidget(self.version_edit, 2, 3)
-        
-        basic_layout.addWidget(QLabel("License:"), 3, 0)
-        self.license_edit = QLineEdit(self.config["license"])
-        basic_layout.addWidget(self.license_edit, 3, 1)
+        # One label/edit pair per config key; each edit is stored as self.<key>_edit
+        for key, label, row, col, *span in _BASIC_FIELDS:
+            basic_layout.addWidget(QLabel(label), row, col)
+            edit = QLineEdit(self.config[key])
+            setattr(self, f"{key}_edit", edit)
+            basic_layout.addWidget(edit, row, col + 1, *span)
         
         layout.addWidget(basic_group)
         
@@ -870,7 +1125,7 @@ class ModernSQLToolGenerator(QMainWindow):
         
         # Info label
         dialect_info = QLabel("SQL syntax will be converted to selected dialect")
-        dialect_info.setStyleSheet("color: #666; font-size: 11px; margin-left: 10px;")
+        dialect_info.setObjectName("dialectInfo")
         dialect_layout.addWidget(dialect_info)
         
         layout.addWidget(dialect_group)
@@ -889,7 +1144,7 @@ class ModernSQLToolGenerator(QMainWindow):
         self.use_quality_check.stateChanged.connect(self.on_checkbox_changed)
         quality_container.addWidget(self.use_quality_check)
         quality_help = QLabel("Evaluates tools based on parameter diversity and SQL complexity")
-        quality_help.setStyleSheet("color: #666; font-size: 11px; margin-left: 30px;")
+        quality_help.setObjectName("optionHelp")
         quality_container.addWidget(quality_help)
         checkbox_layout.addLayout(quality_container)
         
@@ -900,7 +1155,7 @@ class ModernSQLToolGenerator(QMainWindow):
         self.use_param_check.stateChanged.connect(self.on_checkbox_changed)
         param_container.addWidget(self.use_param_check)
         param_help = QLabel("Converts SQL to parameterized templates for reusability")
-        param_help.setStyleSheet("color: #666; font-size: 11px; margin-left: 30px;")
+        param_help.setObjectName("optionHelp")
         param_container.addWidget(param_help)
         checkbox_layout.addLayout(param_container)
         
@@ -911,7 +1166,7 @@ class ModernSQLToolGenerator(QMainWindow):
         self.use_label_check.stateChanged.connect(self.on_checkbox_changed)
         label_container.addWidget(self.use_label_check)
         label_help = QLabel("Adds semantic labels for FAISS retrieval (SELECT, JOIN, etc.)")
-        label_help.setStyleSheet("color: #666; font-size: 11px; margin-left: 30px;")
+        label_help.setObjectName("optionHelp")
         label_container.addWidget(label_help)
         checkbox_layout.addLayout(label_container)
         
@@ -943,7 +1198,7 @@ class ModernSQLToolGenerator(QMainWindow):
         quality_container.addLayout(quality_slider_layout)
         
         quality_help_label = QLabel("Filter tools below this score. Lower = more tools, Higher = premium quality only")
-        quality_help_label.setStyleSheet("color: #666; font-size: 11px; margin-left: 5px;")
+        quality_help_label.setObjectName("qualityHelp")
         quality_container.addWidget(quality_help_label)
         
         options_layout.addLayout(quality_container)
@@ -953,17 +1208,7 @@ class ModernSQLToolGenerator(QMainWindow):
         # Process Button
         self.process_btn = QPushButton("🚀 Start Processing")
         self.process_btn.clicked.connect(self.start_processing)
-        self.process_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                font-size: 16px;
-                padding: 12px 24px;
-                min-height: 20px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-        """)
+        self.process_btn.setObjectName("startButton")
         layout.addWidget(self.process_btn)
         
         # Add stretch to push everything to top
@@ -981,8 +1226,11 @@ class ModernSQLToolGenerator(QMainWindow):
         results_layout = QVBoxLayout(results_group)
         
         # Results text area
-        self.results_text = QTextEdit()
+        self.results_text = QPlainTextEdit()
         self.results_text.setReadOnly(True)
+        # Read-only text is always replaced wholesale, so keep no undo history
+        self.results_text.document().setUndoRedoEnabled(False)
+        self.results_text.document().setMaximumBlockCount(10000)
         
         # Welcome banner
         welcome_banner = """
@@ -992,7 +1240,7 @@ class ModernSQLToolGenerator(QMainWindow):
 
           Processing results will appear here...
 """
-        self.results_text.setPlainText(welcome_banner)
+        self._show_results_text(welcome_banner)
         self.results_text.setPlaceholderText("Processing results will appear here...")
         results_layout.addWidget(self.results_text)
         
@@ -1002,7 +1250,7 @@ class ModernSQLToolGenerator(QMainWindow):
         self.view_tools_btn = QPushButton("🛠️ View Generated Tools")
         self.view_tools_btn.clicked.connect(self.view_generated_tools)
         self.view_tools_btn.setToolTip("View the generated tools YAML file")
-        self.view_tools_btn.setStyleSheet("QPushButton { background-color: #FF9800; }")
+        self.view_tools_btn.setObjectName("viewToolsButton")
         self.view_tools_btn.setVisible(False)  # Initially hidden
         button_layout.addWidget(self.view_tools_btn)
         
@@ -1012,18 +1260,9 @@ class ModernSQLToolGenerator(QMainWindow):
         
         # Export dropdown button
         self.export_btn = QPushButton("💾 Export")
+        # Actions are added the first time the menu opens, not at startup
         export_menu = QMenu(self)
-        
-        # Results export options
-        export_menu.addSeparator()
-        export_menu.addAction("📄 Export Summary as TXT", lambda: self.export_results('txt'))
-        export_menu.addAction("📄 Export Summary as JSON", lambda: self.export_results('json'))
-        
-        # Tools export options (only shown when tools exist)
-        export_menu.addSeparator()
-        export_menu.addAction("🛠️ Export Tools as YAML", lambda: self.export_tools('yaml'))
-        export_menu.addAction("🛠️ Export Tools as JSON", lambda: self.export_tools('json'))
-        export_menu.addAction("🛠️ Export Tools as CSV", lambda: self.export_tools('csv'))
+        export_menu.aboutToShow.connect(self._build_export_menu)
         
         self.export_btn.setMenu(export_menu)
         button_layout.addWidget(self.export_btn)
@@ -1050,8 +1289,6 @@ class ModernSQLToolGenerator(QMainWindow):
         """Import dataset from Hugging Face Hub"""
         try:
             # Simple input dialog for HF dataset name
-            from src.hf_importer import import_from_hf_dataset, normalize_hf_dataset, save_hf_dataset_to_jsonl
-            
             text, ok = QInputDialog.getText(
                 self, 
                 'Import from Hugging Face',
@@ -1065,7 +1302,6 @@ class ModernSQLToolGenerator(QMainWindow):
             dataset_name = text.strip()
             
             # Remove common URL patterns if user pasted a URL
-            import re
             if 'huggingface.co' in dataset_name:
                 # Extract dataset name from URL - match org/repo format
                 # Pattern: huggingface.co/datasets/org/repo or huggingface.co/datasets/org-repo
@@ -1180,8 +1416,7 @@ class ModernSQLToolGenerator(QMainWindow):
             
             # Create datasets directory if it doesn't exist
             datasets_dir = "datasets"
-            if not os.path.exists(datasets_dir):
-                os.makedirs(datasets_dir)
+            os.makedirs(datasets_dir, exist_ok=True)
             
             # Save dataset to datasets directory
             dataset_file = os.path.join(datasets_dir, f"{safe_name}.jsonl")
@@ -1200,7 +1435,6 @@ class ModernSQLToolGenerator(QMainWindow):
             
         except Exception as e:
             # Catch any unexpected errors during import
-            import traceback
             error_details = traceback.format_exc()
             QMessageBox.critical(
                 self,
@@ -1216,84 +1450,130 @@ class ModernSQLToolGenerator(QMainWindow):
             QMessageBox.warning(self, "No File", "Please select a dataset file first")
             return
         
-        if not os.path.exists(file_path):
+        try:
+            file = open(file_path, 'rb')
+        except FileNotFoundError:
             QMessageBox.warning(self, "File Not Found", f"The file does not exist:\n{file_path}")
             return
+        except OSError as e:
+            QMessageBox.warning(self, "Cannot Open File", f"{file_path}:\n{e}")
+            return
         
-        # Open viewer dialog
-        dialog = DatasetViewerDialog(file_path, self)
+        # Open viewer dialog; it takes over the handle
+        dialog = DatasetViewerDialog(file_path, self, file)
         dialog.exec_()
     
     def analyze_dataset(self):
-        """Analyze selected dataset and show statistics"""
+        """Analyze selected dataset in a worker thread; statistics show when it finishes"""
         file_path = self.file_path_edit.text()
         
+        # A newer path supersedes any analysis still running
+        self._stop_analysis()
+        
         # Hide panel if no file
         if not file_path:
             self.dataset_info_group.setVisible(False)
             return
         
-        # Check if file exists
-        if not os.path.exists(file_path):
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            # Path is still being typed or was removed
             self.dataset_info_group.setVisible(False)
             return
+        except OSError as e:
+            self.show_dataset_error(str(e))
+            return
         
-        try:
-            import re
-            # Load dataset
-            data = load_jsonl(file_path)
-            
-            if not data:
-                self.dataset_info_label.setText("Dataset is empty")
-                self.dataset_info_group.setVisible(True)
-                return
-            
-            # Calculate statistics
-            total_records = len(data)
-            
-            # SQL feature analysis
-            sql_keywords = {
-                'SELECT': 0, 'WHERE': 0, 'JOIN': 0, 'GROUP BY': 0,
-                'ORDER BY': 0, 'HAVING': 0, 'UNION': 0, 'WITH': 0
-            }
-            total_sql_length = 0
-            valid_sql_count = 0
-            
-            for item in data:
-                sql = item.get('sql', '')
-                if sql:
-                    valid_sql_count += 1
-                    total_sql_length += len(sql)
-                    sql_upper = sql.upper()
-                    for keyword in sql_keywords.keys():
-                        if keyword in sql_upper:
-                            sql_keywords[keyword] += 1
-            
-            avg_sql_length = int(total_sql_length / valid_sql_count) if valid_sql_count > 0 else 0
-            
-            # Dataset quality indicator
-            quality_features = sum(1 for count in sql_keywords.values() if count > total_records * 0.1)
-            quality_score = min(100, (quality_features * 15 + (valid_sql_count / total_records) * 100))
-            
-            # Format statistics
-            stats_text = f"""Total Records: {total_records:,}
+        # An unchanged file was already analyzed
+        key = (file_path, st.st_mtime_ns, st.st_size)
+        stats = self._analysis_cache.get(key)
+        if stats is not None:
+            self._analysis_cache.move_to_end(key)
+            self.show_dataset_stats(stats)
+            return
+        
+        if self.dataset_info_group.isVisible():
+            self.dataset_info_label.setText("Analyzing dataset...")
+        
+        worker = DatasetAnalysisWorker(file_path, self)
+        worker.analyzed.connect(lambda stats: self._cache_dataset_stats(key, stats))
+        worker.missing.connect(lambda: self.dataset_info_group.setVisible(False))
+        worker.error.connect(self.show_dataset_error)
+        worker.finished.connect(lambda: self._analysis_finished(worker))
+        self._analyze_worker = worker
+        worker.start()
+    
+    def _stop_analysis(self, wait=False):
+        """Detach the running dataset analysis, if any, and ask it to stop"""
+        worker, self._analyze_worker = self._analyze_worker, None
+        if worker is None:
+            return
+        worker.analyzed.disconnect()
+        worker.missing.disconnect()
+        worker.error.disconnect()
+        worker.requestInterruption()
+        if wait:
+            worker.wait()
+    
+    def _analysis_finished(self, worker):
+        """Forget an analysis worker once its thread has ended, and free it"""
+        if self._analyze_worker is worker:
+            self._analyze_worker = None
+        worker.deleteLater()
+    
+    def _cache_dataset_stats(self, key, stats):
+        """Remember a finished analysis for its (path, mtime, size) and show it"""
+        self._analysis_cache[key] = stats
+        if len(self._analysis_cache) > self.ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+        self.show_dataset_stats(stats)
+    
+    def show_dataset_stats(self, stats):
+        """Show dataset statistics from the analysis worker"""
+        total_records = stats['total_records']
+        valid_sql_count = stats['valid_sql_count']
+        total_sql_length = stats['total_sql_length']
+        sql_keywords = stats['sql_keywords']
+        
+        if not total_records:
+            self.dataset_info_label.setText("Dataset is empty")
+            self.dataset_info_group.setVisible(True)
+            return
+        
+        avg_sql_length = int(total_sql_length / valid_sql_count) if valid_sql_count > 0 else 0
+        
+        # Dataset quality indicator
+        quality_features = sum(1 for count in sql_keywords.values() if count * 10 > total_records)
+        quality_score = min(100, (quality_features * 15 + (valid_sql_count / total_records) * 100))
+        
+        # Integer percentages of records using each listed feature
+        feature_lines = "".join([
+            f"- {label}: {sql_keywords[keyword]} ({sql_keywords[keyword] * 100 // total_records}%)\n"
+            for keyword, label in _STATS_FEATURES
+        ])
+        
+        # Format statistics
+        stats_text = f"""Total Records: {total_records:,}
 Valid SQL Queries: {valid_sql_count:,}
 Average SQL Length: {avg_sql_length} chars
 Dataset Quality: {'High' if quality_score > 70 else 'Medium' if quality_score > 40 else 'Low'} ({quality_score:.0f}/100)
 
 SQL Features:
-- WHERE clauses: {sql_keywords['WHERE']} ({sql_keywords['WHERE']*100//total_records}%)
-- JOIN operations: {sql_keywords['JOIN']} ({sql_keywords['JOIN']*100//total_records}%)
-- GROUP BY: {sql_keywords['GROUP BY']} ({sql_keywords['GROUP BY']*100//total_records}%)
-- ORDER BY: {sql_keywords['ORDER BY']} ({sql_keywords['ORDER BY']*100//total_records}%)
-"""
-            
-            self.dataset_info_label.setText(stats_text)
-            self.dataset_info_group.setVisible(True)
-            
-        except Exception as e:
-            self.dataset_info_label.setText(f"Error analyzing dataset: {str(e)}")
-            self.dataset_info_group.setVisible(True)
+{feature_lines}"""
+        
+        self.dataset_info_label.setText(stats_text)
+        self.dataset_info_group.setVisible(True)
+    
+    def show_dataset_error(self, message):
+        """Show a dataset analysis failure"""
+        self.dataset_info_label.setText(f"Error analyzing dataset: {message}")
+        self.dataset_info_group.setVisible(True)
+    
+    def closeEvent(self, event):
+        """Stop a running dataset analysis before the window goes away"""
+        self._stop_analysis(wait=True)
+        super().closeEvent(event)
             
     def update_quality_label(self, value):
         """Update quality score label"""
@@ -1328,8 +1608,9 @@ SQL Features:
         self.process_btn.setEnabled(False)
         
         # Clear results panel and show "Starting..." message
+        self._results_dirty = False
         if self.results_text is not None:
-            self.results_text.setPlainText("Starting processing...\nPlease wait...")
+            self._show_results_text("Starting processing...\nPlease wait...")
         
         # Create and start worker thread
         self.worker = ProcessingWorker(self.config)
@@ -1351,7 +1632,7 @@ SQL Features:
         elif dialect == "postgresql":
             dialect = "postgres"
         
-        self.config.update({
+        new_config = {
             "output_file": self.output_file_edit.text(),
             "tool_name": self.tool_name_edit.text(),
             "description": self.description_edit.text(),
@@ -1364,49 +1645,65 @@ SQL Features:
             "use_labeling": self.use_label_check.isChecked(),
             "min_quality_score": self.quality_slider.value(),
             "sql_dialect": dialect
-        })
-        
+        }
+        # Push only the fields that changed since the last run
+        changed = {k: v for k, v in new_config.items() if self.config.get(k) != v}
+        if changed:
+            self.config.update(changed)
+        
+    def _reset_processing_ui(self, tools_ready=False):
+        """Restore the controls after a run, batching the widget changes into one repaint"""
+        self.setUpdatesEnabled(False)
+        try:
+            self.processing = False
+            self.process_btn.setText("🚀 Start Processing")
+            self.process_btn.setEnabled(True)
+            if tools_ready:
+                # Show View Generated Tools button
+                self.view_tools_btn.setVisible(True)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _release_worker(self):
+        """Drop the finished worker thread so it and its connections can be freed"""
+        worker, self.worker = self.worker, None
+        if worker is None:
+            return
+        worker.wait()  # run() returns right after emitting its last signal
+        worker.deleteLater()
+    
     def processing_finished(self, results):
         """Handle processing finished"""
-        self.processing = False
-        self.process_btn.setText("🚀 Start Processing")
-        self.process_btn.setEnabled(True)
+        self._preview_timer.stop()
+        self._release_worker()
+        self._reset_processing_ui(tools_ready=True)
         
         self.results = results
+        # Resolved once per run; the summary may be rendered again later
+        self._output_path = self._resolve_output_path(results.get('output_file', self.config['output_file']))
         self.update_results()
-        
-        # Show View Generated Tools button
-        self.view_tools_btn.setVisible(True)
-        
     
     def handle_stats(self, stats):
         """Handle processing statistics"""
         self.processing_stats = stats
-        self.update_processing_preview()
+        if not self._preview_timer.isActive():
+            self._preview_timer.start()
     
     def update_processing_preview(self):
         """Update results panel with processing preview"""
         if self.results_text is None:
             return
         
-        # Build preview text with simple banner
-        preview_text = """
-                   Welcome to ToolMint                        
-              SQL Tool Generation Platform                    
-
-
-Processing in Progress...
-
-"""
+        preview_text = _PREVIEW_HEADER
         
         # Add stats if available
         if self.processing_stats:
-            stats = self.processing_stats
-            processed = stats.get('processed', 0)
-            total = stats.get('total', 0)
-            filtered = stats.get('filtered', 0)
-            elapsed = stats.get('elapsed', '0')
-            eta = stats.get('eta', 'Calculating...')
+            get = self.processing_stats.get
+            processed = get('processed', 0)
+            total = get('total', 0)
+            filtered = get('filtered', 0)
+            elapsed = get('elapsed', '0')
+            eta = get('eta', 'Calculating...')
             
             # Calculate progress percentage
             if total > 0:
@@ -1414,23 +1711,21 @@ Processing in Progress...
             else:
                 progress_pct = 0
             
-            # Create ASCII progress bar
-            bar_width = 50
-            filled = int((progress_pct / 100) * bar_width)
-            progress_bar = "[" + "█" * filled + "░" * (bar_width - filled) + "]"
+            # ASCII progress bar, sliced from the prebuilt full and empty bars
+            filled = int((progress_pct / 100) * _PROGRESS_BAR_WIDTH)
             
-            preview_text += f"Progress: {processed}/{total} items processed ({progress_pct}%)\n"
-            preview_text += f"{progress_bar}\n\n"
-            preview_text += f"Filtered: {filtered} items\n"
-            preview_text += f"Elapsed: {elapsed}s | ETA: {eta}\n"
+            preview_text += _PREVIEW_STATS_TMPL % (
+                processed, total, progress_pct,
+                _PROGRESS_BAR_FULL[:filled], _PROGRESS_BAR_EMPTY[filled:],
+                filtered, elapsed, eta)
         
-        self.results_text.setPlainText(preview_text)
+        self._show_results_text(preview_text)
     
     def processing_error(self, error_msg):
         """Handle processing error"""
-        self.processing = False
-        self.process_btn.setText("🚀 Start Processing")
-        self.process_btn.setEnabled(True)
+        self._preview_timer.stop()
+        self._release_worker()
+        self._reset_processing_ui()
         
         # Create a more detailed error dialog
         error_dialog = QMessageBox(self)
@@ -1446,33 +1741,54 @@ Processing in Progress...
             self.status_label.setText("Processing failed - see error dialog")
         
     def update_results(self):
-        """Update results display"""
-        if self.results_text is None:
+        """Mark the results summary stale and render it if the panel can be seen"""
+        self._results_dirty = True
+        if self.results_text is not None and self.results_text.isVisible() and not self.isMinimized():
+            self._render_results()
+    
+    def showEvent(self, event):
+        """Render results that finished while the window was hidden"""
+        super().showEvent(event)
+        self._render_results()
+    
+    def _render_results(self):
+        """Build the results summary text, only when it is stale"""
+        if not self._results_dirty or self.results_text is None:
             return
-        output_file = self.results.get('output_file', self.config['output_file'])
-        output_path = os.path.abspath(output_file)
+        self._results_dirty = False
+        output_path = self._output_path
+        results = self.results
+        config = self.config
+        
+        # First failures and default-score fallbacks, only when there were any
+        failures = "".join(f"- {sample}\n" for sample in results.get('failed_samples', ()))
+        if failures:
+            failures = f"First failures:\n{failures}"
+        if results.get('score_errors'):
+            failures += f"Tools with default quality score (scoring error): {results['score_errors']}\n"
         
         results_text = f"""Processing Results:
 ========================
 
-Input File: {self.results['input_file']}
-Items Processed: {self.results['items_processed']}
-Tools Created: {self.results['tools_created']}
-Processing Time: {self.results['processing_time']}
-
+Input File: {results['input_file']}
+Items Processed: {results['items_processed']}
+Tools Created: {results['tools_created']}
+Failed Items: {results.get('failed', 0)}
+Processing Time: {results['processing_time']}
+{failures}
 Configuration:
-- Output File: {self.config['output_file']}
-- Tool Name: {self.config['tool_name']}
-- Description: {self.config['description']}
-- Author: {self.config['author']}
-- Version: {self.config['version']}
-- License: {self.config['license']}
+- Output File: {config['output_file']}
+- Tool Name: {config['tool_name']}
+- Description: {config['description']}
+- Author: {config['author']}
+- Version: {config['version']}
+- License: {config['license']}
 
 Processing Options:
-- Quality Scoring: {self.config['use_quality_scoring']}
-- Parameterization: {self.config['use_parameterization']}
-- Labeling: {self.config['use_labeling']}
-- Min Quality Score: {self.config['min_quality_score']}
+- Quality Scoring: {config['use_quality_scoring']}
+- Parameterization: {config['use_parameterization']}
+- Labeling: {config['use_labeling']}
+- Min Quality Score: {config['min_quality_score']}
 
 📁 OUTPUT FILE LOCATION:
 {output_path}
@@ -1481,13 +1797,49 @@ The tools have been generated and saved to the YAML file above.
 You can open this file to view the generated SQL tools.
 """
         
-        self.results_text.setPlainText(results_text)
+        # Lay the document out once, after the whole text is in
+        self.results_text.setUpdatesEnabled(False)
+        try:
+            self._show_results_text(results_text)
+        finally:
+            self.results_text.setUpdatesEnabled(True)
+        
+    def _build_export_menu(self):
+        """Populate the export menu on first open"""
+        export_menu = self.export_btn.menu()
+        if not export_menu.isEmpty():
+            return
+        
+        # Results export options
+        export_menu.addSeparator()
+        export_menu.addAction("📄 Export Summary as TXT", partial(self.export_results, 'txt'))
+        export_menu.addAction("📄 Export Summary as JSON", partial(self.export_results, 'json'))
+        
+        # Tools export options (only shown when tools exist)
+        export_menu.addSeparator()
+        export_menu.addAction("🛠️ Export Tools as YAML", partial(self.export_tools, 'yaml'))
+        export_menu.addAction("🛠️ Export Tools as JSON", partial(self.export_tools, 'json'))
+        export_menu.addAction("🛠️ Export Tools as CSV", partial(self.export_tools, 'csv'))
+        
+    def _show_results_text(self, text):
+        """Replace the results view text, keeping a copy for the clipboard"""
+        if text == self._results_text_cache:
+            return
+        self._results_text_cache = text
+        self.results_text.setPlainText(text)
+        
+    def _resolve_output_path(self, output_file):
+        """Make a relative output path absolute against the startup directory"""
+        if os.path.isabs(output_file):
+            return output_file
+        return os.path.normpath(os.path.join(self._cwd, output_file))
         
     def copy_results(self):
         """Copy results to clipboard"""
+        self._render_results()
         clipboard = QApplication.clipboard()
-        if clipboard is not None and self.results_text is not None:
-            clipboard.setText(self.results_text.toPlainText())
+        if clipboard is not None:
+            clipboard.setText(self._results_text_cache)
         if self.status_label is not None:
             self.status_label.setText("Results copied to clipboard")
         
@@ -1519,10 +1871,7 @@ You can open this file to view the generated SQL tools.
     
     def export_tools(self, format_type):
         """Export generated tools"""
-        output_file = self.config.get('output_file', 'tools.yaml')
-        
-        if not os.path.isabs(output_file):
-            output_file = os.path.join(os.getcwd(), output_file)
+        output_file = self._resolve_output_path(self.config.get('output_file', 'tools.yaml'))
         
         if not os.path.exists(output_file):
             QMessageBox.warning(
@@ -1537,7 +1886,6 @@ You can open this file to view the generated SQL tools.
                 self, "Export Tools", "", "YAML files (*.yaml *.yml);;All files (*.*)"
             )
             if filename:
-                from src.export import export_tools_to_yaml
                 export_tools_to_yaml(output_file, filename)
                 if self.status_label is not None:
                     self.status_label.setText(f"Tools exported to {filename}")
@@ -1560,8 +1908,9 @@ You can open this file to view the generated SQL tools.
             
     def clear_results(self):
         """Clear results"""
+        self._results_dirty = False
         if self.results_text is not None:
-            self.results_text.clear()
+            self._show_results_text("")
         self.results = {}
         self.processing_stats = {}
         if self.status_label is not None:
@@ -1573,20 +1922,20 @@ You can open this file to view the generated SQL tools.
     def view_generated_tools(self):
         """View the generated tools YAML file"""
         # Get output file path
-        output_file = self.config.get('output_file', 'tools.yaml')
+        output_file = self._resolve_output_path(self.config.get('output_file', 'tools.yaml'))
         
-        # If not absolute path, make it relative to current directory
-        if not os.path.isabs(output_file):
-            output_file = os.path.join(os.getcwd(), output_file)
-        
-        # Check if file exists
-        if not os.path.exists(output_file):
+        # Report a missing file before the dialog opens; the dialog loads it
+        try:
+            os.stat(output_file)
+        except FileNotFoundError:
             QMessageBox.warning(
                 self, 
                 "File Not Found", 
                 f"No generated tools file found.\n\nExpected location:\n{output_file}\n\nPlease generate tools first."
             )
             return
+        except OSError:
+            pass  # The dialog's load fails too and shows the error
         
         # Open tools viewer dialog
         dialog = ToolsViewerDialog(output_file, self)
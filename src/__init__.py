@@ -10,7 +10,8 @@ from .quality import (
 )
 from .labels import generate_labels, generate_sql_operation_labels
 from .validation import validate_tool, validate_tool_advanced, create_tool
-from .io_operations import load_jsonl, save_jsonl, merge_yaml, normalize
+from .io_operations import (iter_jsonl, load_jsonl, save_jsonl, merge_yaml, normalize,
+                            YAMLToolStream, load_yaml, load_yaml_cached, dump_yaml)
 from .utils import sha, slug, generate_smart_tool_name
 
 __all__ = [
@@ -19,6 +20,7 @@ __all__ = [
     'generate_labels',
     'validate_tool_advanced',
     'create_tool',
+    'iter_jsonl',
     'load_jsonl',
     'save_jsonl',
     'normalize',
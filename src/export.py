@@ -3,32 +3,34 @@
 
 import json
 import csv
-import yaml
 import os
 from typing import Dict, Any, List
 
+from .io_operations import load_yaml_cached, dump_yaml
+
+# json.dump, csv and yaml emit many small writes; a larger buffer batches them
+WRITE_BUFFER_SIZE = 1 << 16
+
 def export_tools_to_json(yaml_path: str, output_path: str):
     """Export tools from YAML file to JSON format"""
-    with open(yaml_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
-        if data is None or not isinstance(data, dict):
-            data = {}
+    data = load_yaml_cached(yaml_path)
+    if data is None or not isinstance(data, dict):
+        data = {}
     
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
 
 def export_tools_to_csv(yaml_path: str, output_path: str):
     """Export tools from YAML file to CSV format"""
-    with open(yaml_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
-        if data is None or not isinstance(data, dict):
-            data = {}
+    data = load_yaml_cached(yaml_path)
+    if data is None or not isinstance(data, dict):
+        data = {}
     
     tools = data.get('tools', {})
     
     if not tools:
         # Create empty CSV with headers
-        with open(output_path, 'w', encoding='utf-8', newline='') as f:
+        with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE, newline='') as f:
             writer = csv.writer(f)
             writer.writerow(['tool_name', 'description', 'sql', 'param_count', 'quality_score', 'labels', 'db_id', 'source'])
         return
@@ -50,20 +52,19 @@ def export_tools_to_csv(yaml_path: str, output_path: str):
         rows.append(row)
     
     # Write CSV
-    with open(output_path, 'w', encoding='utf-8', newline='') as f:
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE, newline='') as f:
         writer = csv.writer(f)
         writer.writerow(['tool_name', 'description', 'sql', 'param_count', 'quality_score', 'labels', 'db_id', 'source'])
         writer.writerows(rows)
 
 def export_tools_to_yaml(yaml_path: str, output_path: str):
     """Copy tools from source YAML to output YAML"""
-    with open(yaml_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
-        if data is None or not isinstance(data, dict):
-            data = {}
+    data = load_yaml_cached(yaml_path)
+    if data is None or not isinstance(data, dict):
+        data = {}
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True, width=1000)
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        dump_yaml(data, f)
 
 def export_results_to_txt(results_dict: Dict[str, Any], output_path: str):
     """Export processing results summary to text file"""
@@ -73,6 +74,7 @@ def export_results_to_txt(results_dict: Dict[str, Any], output_path: str):
 Input File: {results_dict.get('input_file', 'N/A')}
 Items Processed: {results_dict.get('items_processed', 0)}
 Tools Created: {results_dict.get('tools_created', 0)}
+Failed Items: {results_dict.get('failed', 0)}
 Processing Time: {results_dict.get('processing_time', 'N/A')}
 
 Configuration:
@@ -90,11 +92,11 @@ Processing Options:
 - Min Quality Score: {results_dict.get('min_quality_score', 50)}
 """
     
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
         f.write(text)
 
 def export_results_to_json(results_dict: Dict[str, Any], output_path: str):
     """Export processing results summary to JSON file"""
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
         json.dump(results_dict, f, indent=2, ensure_ascii=False)
 
@@ -3,22 +3,93 @@
 
 import os
 import json
+import mmap
+import shutil
+import threading
 import yaml
-from typing import Dict, Any, List
+from array import array
+from functools import lru_cache
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple, Union
 
-def load_jsonl(path: str) -> List[Dict[str, Any]]:
-    """Load records from JSONL file"""
-    arr = []
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+# Writes stay on the pure-Python dumper: libyaml escapes non-BMP characters
+# such as emoji as "\U..." sequences, where safe_dump writes them literally
+from yaml import SafeDumper as _SafeDumper
+
+# JSONL line indexes kept per (path, mtime_ns, size), most recent last;
+# filled from viewer worker threads, hence the lock
+LINE_OFFSETS_CACHE_SIZE = 8
+_line_offsets_cache: "OrderedDict[Tuple[str, int, int], Tuple[array, array]]" = OrderedDict()
+_line_offsets_lock = threading.Lock()
+
+# Bumped when the sidecar layout changes, or to drop sidecars written by older rules
+_YAML_SIDECAR_VERSION = 1
+
+def iter_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield records from JSONL file one at a time, skipping malformed lines"""
     with open(path, "r", encoding="utf-8") as f:
         for line in f:
             line = line.strip()
             if not line: 
                 continue
             try: 
-                arr.append(json.loads(line))
+                rec = json.loads(line)
             except: 
-                pass
-    return arr
+                continue
+            yield rec
+
+def load_jsonl(path: str) -> List[Dict[str, Any]]:
+    """Load records from JSONL file"""
+    return list(iter_jsonl(path))
+
+def jsonl_line_offsets(path: str, should_stop: Optional[Callable[[], bool]] = None) -> Optional[Tuple[array, array]]:
+    """Start/end byte offsets of the lines of a JSONL file that hold a JSON object
+    
+    The index is kept in memory per (path, mtime, size), so reopening an
+    unchanged file does not rescan it. should_stop is polled during a scan;
+    once it returns True the scan is abandoned and None is returned.
+    """
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    with _line_offsets_lock:
+        offsets = _line_offsets_cache.get(key)
+        if offsets is not None:
+            _line_offsets_cache.move_to_end(key)
+            return offsets
+    
+    offsets = _scan_jsonl_lines(path, st.st_size, should_stop)
+    if offsets is not None:
+        with _line_offsets_lock:
+            _line_offsets_cache[key] = offsets
+            if len(_line_offsets_cache) > LINE_OFFSETS_CACHE_SIZE:
+                _line_offsets_cache.popitem(last=False)
+    return offsets
+
+def _scan_jsonl_lines(path: str, size: int, should_stop: Optional[Callable[[], bool]]) -> Optional[Tuple[array, array]]:
+    """Scan one version of a JSONL file for record lines"""
+    starts, ends = array("q"), array("q")
+    if not size:
+        return starts, ends
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        pos = 0
+        lines = 0
+        while pos < size:
+            lines += 1
+            if should_stop is not None and not lines & 4095 and should_stop():
+                return None
+            end = mm.find(b"\n", pos)
+            if end < 0:
+                end = size
+            if mm[pos:end].lstrip().startswith(b"{"):
+                starts.append(pos)
+                ends.append(end)
+            pos = end + 1
+    return starts, ends
 
 def save_jsonl(path: str, arr: List[Dict[str, Any]]):
     """Save records to JSONL file"""
@@ -34,21 +105,170 @@ def normalize(rec: Dict[str, Any]) -> Dict[str, Any]:
     src = rec.get("source") or rec.get("origin") or "unknown"
     return {"question": q.strip(), "sql": sql.strip(), "db_id": db, "source": src}
 
-def merge_yaml(out_path: str, tools: List[Dict[str, Any]]):
-    """Merge tools into YAML file"""
-    if os.path.exists(out_path):
-        with open(out_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-            if not isinstance(data, dict):
-                data = {}
-    else:
-        data = {}
+def load_yaml(path: str) -> Any:
+    """Parse a YAML file with the libyaml-backed safe loader when available"""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+def dump_yaml(data: Any, stream=None):
+    """Dump YAML in ToolMint's layout, exactly as yaml.safe_dump with those options
+    
+    Returns the text when no stream is given.
+    """
+    return yaml.dump(data, stream, Dumper=_SafeDumper, sort_keys=False, allow_unicode=True, width=1000)
+
+def load_yaml_cached(path: str, sidecar: bool = False) -> Any:
+    """Parse a YAML file, reusing earlier parses while the file is unchanged
+    
+    Results are kept in memory per (path, mtime, size). With sidecar=True they
+    are also kept across runs in a JSON file next to it (path + ".cache.json"),
+    provided JSON represents the data exactly. The returned object is shared
+    between callers and must not be modified.
+    """
+    st = os.stat(path)
+    return _load_yaml_cached(path, st.st_mtime_ns, st.st_size, sidecar)
+
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int, sidecar: bool) -> Any:
+    """Parse one version of a YAML file, through the JSON sidecar if asked"""
+    if not sidecar:
+        return load_yaml(path)
+    
+    cache_path = path + ".cache.json"
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if (cached.get("version") == _YAML_SIDECAR_VERSION
+                and cached.get("mtime_ns") == mtime_ns and cached.get("size") == size):
+            return cached["data"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    
+    data = load_yaml(path)
+    try:
+        text = json.dumps({"version": _YAML_SIDECAR_VERSION, "mtime_ns": mtime_ns, "size": size, "data": data},
+                          ensure_ascii=False)
+        # Non-string keys, dates and the like would come back changed
+        exact = json.loads(text)["data"] == data
+    except (TypeError, ValueError):
+        exact = False
+    try:
+        if exact:
+            with open(cache_path, "w", encoding="utf-8") as f:
+                f.write(text)
+        elif os.path.exists(cache_path):
+            os.remove(cache_path)
+    except OSError:
+        # Unwritable directory; parse again next time
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+    return data
+
+def _load_yaml_dict(path: str) -> Dict[str, Any]:
+    """Load a YAML file as a mapping, or an empty one if it is missing or not a mapping"""
+    if not os.path.exists(path):
+        return {}
+    data = load_yaml(path)
+    return data if isinstance(data, dict) else {}
+
+def merge_yaml(out_path: str, tools: Union[Dict[str, Any], List[Dict[str, Any]]]):
+    """Merge tools into YAML file (a name -> tool mapping or a list of single-tool dicts)"""
+    data = _load_yaml_dict(out_path)
     
     if "tools" not in data:
         data["tools"] = {}
     
-    for t in tools:
-        data["tools"].update(t)
+    if isinstance(tools, dict):
+        data["tools"].update(tools)
+    else:
+        for t in tools:
+            data["tools"].update(t)
     
     with open(out_path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True, width=1000)
+        dump_yaml(data, f)
+
+def _dump_tool(name: str, tool: Dict[str, Any]) -> str:
+    """Dump one tool as an entry of the top-level tools mapping"""
+    # Dumped at its real depth, so long scalars fold where a full dump folds them
+    text = dump_yaml({"tools": {name: tool}})
+    return text[text.index("\n") + 1:]
+
+class YAMLToolStream:
+    """Write tools to a YAML file as they are produced, merging like merge_yaml.
+    
+    Each tool is dumped to a side file as soon as it is written, so nothing
+    accumulates in memory. close() (or leaving the with block, including on
+    Ctrl-C) writes the final file with dict.update semantics: tools already in
+    out_path keep their place, new names follow in first-write order, and a
+    name written more than once keeps the last tool written for it. Nothing
+    is touched if no tool was written.
+    """
+    
+    def __init__(self, out_path: str):
+        self.out_path = out_path
+        self._spans: Dict[str, Tuple[int, int]] = {}  # name -> (start, end) of its latest entry in the side file
+        self._size = 0
+        self._part_path = out_path + ".part"
+        self._part = open(self._part_path, "wb")
+    
+    def __enter__(self) -> "YAMLToolStream":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    @property
+    def names(self):
+        """Distinct tool names written so far"""
+        return self._spans.keys()
+    
+    def write(self, name: str, tool: Dict[str, Any]):
+        """Append a tool; a repeated name replaces the earlier tool in the final file"""
+        entry = _dump_tool(name, tool).encode("utf-8")
+        self._part.write(entry)
+        start = self._size
+        self._size += len(entry)
+        self._spans[name] = (start, self._size)
+    
+    def close(self):
+        """Write the merged YAML file and remove the side file"""
+        if self._part.closed:
+            return
+        self._part.close()
+        try:
+            spans = self._spans
+            if not spans:
+                return
+            data = _load_yaml_dict(self.out_path)
+            existing = data.pop("tools", None) or {}
+            tmp_path = self.out_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write("tools:\n")
+                if existing.keys().isdisjoint(spans) and sum(end - start for start, end in spans.values()) == self._size:
+                    # Every name is new and written once: the side file is the tail as is
+                    for name, tool in existing.items():
+                        f.write(_dump_tool(name, tool))
+                    with open(self._part_path, "r", encoding="utf-8") as part:
+                        shutil.copyfileobj(part, f)
+                else:
+                    with open(self._part_path, "rb") as part:
+                        def copy_entry(name: str):
+                            start, end = spans[name]
+                            part.seek(start)
+                            f.write(part.read(end - start).decode("utf-8"))
+                        
+                        for name, tool in existing.items():
+                            if name in spans:
+                                copy_entry(name)
+                            else:
+                                f.write(_dump_tool(name, tool))
+                        for name in spans:
+                            if name not in existing:
+                                copy_entry(name)
+                if data:
+                    dump_yaml(data, f)
+            os.replace(tmp_path, self.out_path)
+        finally:
+            os.remove(self._part_path)
@@ -4,6 +4,12 @@
 import re
 from typing import List
 
+# Aggregate patterns, compiled once and matched against upper-cased SQL
+_COUNT_RE = re.compile(r'\bCOUNT\s*\(')
+_SUM_RE = re.compile(r'\bSUM\s*\(')
+_AVG_RE = re.compile(r'\bAVG\s*\(')
+_MINMAX_RE = re.compile(r'\b(MAX|MIN)\s*\(')
+
 def generate_sql_operation_labels(sql: str) -> List[str]:
     """Generate operation labels (SELECT, INSERT, UPDATE, etc.)"""
     labels = []
@@ -40,13 +46,13 @@ def generate_sql_structure_labels(sql: str) -> List[str]:
         labels.append('right_join')
     
     # Aggregates
-    if re.search(r'\bCOUNT\s*\(', sql_upper):
+    if _COUNT_RE.search(sql_upper):
         labels.append('count')
-    if re.search(r'\bSUM\s*\(', sql_upper):
+    if _SUM_RE.search(sql_upper):
         labels.append('sum')
-    if re.search(r'\bAVG\s*\(', sql_upper):
+    if _AVG_RE.search(sql_upper):
         labels.append('avg')
-    if re.search(r'\b(MAX|MIN)\s*\(', sql_upper):
+    if _MINMAX_RE.search(sql_upper):
         labels.append('minmax')
     
     # Grouping and ordering
@@ -4,6 +4,24 @@
 import re
 from typing import Dict, Any, List, Tuple, Set
 
+# Patterns used by the parameterization passes, compiled once at import
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+_DOUBLE_QUOTED_RE = re.compile(r'"([^"]+)"')
+_SINGLE_QUOTED_RE = re.compile(r"'([^']+)'")
+_NUMBER_RE = re.compile(r'\b(\d+(?:\.\d+)?)\b')
+_TABLE_RE = re.compile(r'\b(FROM|JOIN|INTO|UPDATE)\s+([a-zA-Z_][\w]*)', re.I)
+_AGGREGATE_RE = re.compile(r'\b(COUNT|SUM|AVG|MAX|MIN|GROUP_CONCAT|DISTINCT)\s*\(', re.I)
+_IDENTIFIER_RE = re.compile(r'^[a-zA-Z_][\w]*$')
+_SELECT_RE = re.compile(r'\b(SELECT)\s+(.*?)\s+(FROM)\b', re.I | re.DOTALL)
+_GROUP_BY_RE = re.compile(r'\b(GROUP\s+BY)\s+([^;]+?)(?=\s+(?:ORDER|HAVING|LIMIT|;|$))', re.I)
+_LIMIT_RE = re.compile(r'\bLIMIT\s+(\d+)', re.I)
+_OFFSET_RE = re.compile(r'\bOFFSET\s+(\d+)', re.I)
+_ORDER_BY_RE = re.compile(r'\bORDER\s+BY\s+([a-zA-Z_][\w\.]*(?:\([^)]*\))?)\s*(ASC|DESC)?', re.I)
+_WHERE_RE = re.compile(
+    r'\b(WHERE)\s+([a-zA-Z_][\w\.]*)\s+(=|!=|<>|>=|<=|>|<|IN|NOT\s+IN|LIKE|NOT\s+LIKE|IS|IS\s+NOT)\b', re.I
+)
+_JOIN_ON_RE = re.compile(r'\b(ON)\s+([a-zA-Z_][\w\.]+)\s*(=|!=|<>|>=|<=|>|<)\s*([a-zA-Z_][\w\.]+)', re.I)
+
 class SQLParameterizer:
     """Parse SQL and parameterize literal values"""
     
@@ -93,31 +111,29 @@ class SQLParameterizer:
             if '%' in value:
                 # Covers patterns like "8/%"
                 base_value = value.replace('%', '').replace('/', '_').strip('_')
-                safe_value = re.sub(r'[^a-z0-9]+', '_', base_value.lower()).strip('_')[:20]
+                safe_value = _NON_ALNUM_RE.sub('_', base_value.lower()).strip('_')[:20]
                 param_name = self._make_param_name(safe_value or "pattern", "string")
                 # Preserve the original pattern in the description
                 self._add_param(param_name, "string", f"String pattern for LIKE", value)
                 return f"{{{{.{param_name}}}}}"
             
             # Derive a meaningful parameter name
-            safe_value = re.sub(r'[^a-z0-9]+', '_', value.lower()).strip('_')[:20]
+            safe_value = _NON_ALNUM_RE.sub('_', value.lower()).strip('_')[:20]
             param_name = self._make_param_name(safe_value or "str_value", "string")
             
             self._add_param(param_name, "string", f"String value", value)
             return f"{{{{.{param_name}}}}}"
         
         # Process double quotes first
-        sql = re.sub(r'"([^"]+)"', replacer, sql)
+        sql = _DOUBLE_QUOTED_RE.sub(replacer, sql)
         # Then handle single quotes
-        sql = re.sub(r"'([^']+)'", replacer, sql)
+        sql = _SINGLE_QUOTED_RE.sub(replacer, sql)
         
         return sql
     
     def _parameterize_numbers(self, sql: str) -> str:
         """Parameterize numeric literals in WHERE/HAVING/BETWEEN contexts"""
         # LIMIT and OFFSET are handled separately
-        pattern = r'\b(\d+(?:\.\d+)?)\b'
-        
         def replacer(match):
             value = match.group(1)
             pos = match.start()
@@ -144,7 +160,7 @@ class SQLParameterizer:
             
             return match.group(0)
         
-        return re.sub(pattern, replacer, sql)
+        return _NUMBER_RE.sub(replacer, sql)
     
     def _parameterize_tables_names(self, sql: str) -> str:
         """Parameterize table names following FROM/JOIN/INTO/UPDATE"""
@@ -163,7 +179,7 @@ class SQLParameterizer:
             self._add_param(param_name, "string", f"Table name", table)
             return f"{keyword} {{{{.{param_name}}}}}"
         
-        sql = re.sub(r'\b(FROM|JOIN|INTO|UPDATE)\s+([a-zA-Z_][\w]*)', from_replacer, sql, flags=re.I)
+        sql = _TABLE_RE.sub(from_replacer, sql)
         return sql
     
     def _parameterize_select_columns(self, sql: str) -> str:
@@ -180,7 +196,7 @@ class SQLParameterizer:
                 return match.group(0)
             
             # Avoid modifying aggregates such as COUNT, SUM, etc.
-            if re.search(r'\b(COUNT|SUM|AVG|MAX|MIN|GROUP_CONCAT|DISTINCT)\s*\(', columns_str, re.I):
+            if _AGGREGATE_RE.search(columns_str):
                 return match.group(0)
             
             # Split comma-separated columns
@@ -194,7 +210,7 @@ class SQLParameterizer:
                     continue
                 
                 # Parameterize simple identifiers
-                if re.match(r'^[a-zA-Z_][\w]*$', col):
+                if _IDENTIFIER_RE.match(col):
                     param_name = self._make_param_name(f"select_col_{i}" if i > 1 else "select_col", "string")
                     self._add_param(param_name, "string", f"Column to select", col)
                     parameterized_cols.append(f"{{{{.{param_name}}}}}")
@@ -204,12 +220,7 @@ class SQLParameterizer:
             return f"{select_kw} {', '.join(parameterized_cols)} {from_kw}"
         
         # SELECT ... FROM pattern'i yakala
-        sql = re.sub(
-            r'\b(SELECT)\s+(.*?)\s+(FROM)\b',
-            select_replacer,
-            sql,
-            flags=re.I | re.DOTALL
-        )
+        sql = _SELECT_RE.sub(select_replacer, sql)
         
         return sql
     
@@ -248,7 +259,7 @@ class SQLParameterizer:
                     continue
                 
                 # Handle simple identifiers
-                if re.match(r'^[a-zA-Z_][\w]*$', col):
+                if _IDENTIFIER_RE.match(col):
                     param_name = self._make_param_name(f"group_col_{i}" if i > 1 else "group_col", "string")
                     self._add_param(param_name, "string", f"Column to group by", col)
                     parameterized_cols.append(f"{{{{.{param_name}}}}}")
@@ -258,12 +269,7 @@ class SQLParameterizer:
             return f"{group_kw} {', '.join(parameterized_cols)}"
         
         # GROUP BY pattern stops before ORDER BY/LIMIT/OFFSET
-        sql = re.sub(
-            r'\b(GROUP\s+BY)\s+([^;]+?)(?=\s+(?:ORDER|HAVING|LIMIT|;|$))',
-            group_replacer,
-            sql,
-            flags=re.I
-        )
+        sql = _GROUP_BY_RE.sub(group_replacer, sql)
         
         return sql
     
@@ -279,7 +285,7 @@ class SQLParameterizer:
             self._add_param(param_name, "string", f"Maximum number of rows", value)
             return f"LIMIT {{{{.{param_name}}}}}"
         
-        sql = re.sub(r'\bLIMIT\s+(\d+)', limit_replacer, sql, flags=re.I)
+        sql = _LIMIT_RE.sub(limit_replacer, sql)
         
         # OFFSET n
         def offset_replacer(match):
@@ -290,7 +296,7 @@ class SQLParameterizer:
             self._add_param(param_name, "string", f"Number of rows to skip", value)
             return f"OFFSET {{{{.{param_name}}}}}"
         
-        sql = re.sub(r'\bOFFSET\s+(\d+)', offset_replacer, sql, flags=re.I)
+        sql = _OFFSET_RE.sub(offset_replacer, sql)
         
         # ORDER BY column/expression [ASC|DESC]
         def order_replacer(match):
@@ -329,12 +335,7 @@ class SQLParameterizer:
         # - [a-zA-Z_][\w\.]* : column or function name prefix
         # - (?:\([^)]*\))? : optional parentheses and contents for functions
         # Non-greedy to correctly capture COUNT(*) DESC patterns
-        sql = re.sub(
-            r'\bORDER\s+BY\s+([a-zA-Z_][\w\.]*(?:\([^)]*\))?)\s*(ASC|DESC)?',
-            order_replacer,
-            sql,
-            flags=re.I
-        )
+        sql = _ORDER_BY_RE.sub(order_replacer, sql)
         
         return sql
     
@@ -367,7 +368,7 @@ class SQLParameterizer:
                 return match.group(0)
             
             # Handle simple column identifiers
-            if re.match(r'^[a-zA-Z_][\w]*$', column):
+            if _IDENTIFIER_RE.match(column):
                 param_name = self._make_param_name("where_col", "string")
                 self._add_param(param_name, "string", f"Column to filter on", column)
                 return f"{where_kw} {{{{.{param_name}}}}} {operator}"
@@ -375,12 +376,7 @@ class SQLParameterizer:
             return match.group(0)
         
         # Supported operators: =, !=, <>, >, <, >=, <=, IN, NOT IN, LIKE, NOT LIKE, IS, IS NOT
-        sql = re.sub(
-            r'\b(WHERE)\s+([a-zA-Z_][\w\.]*)\s+(=|!=|<>|>=|<=|>|<|IN|NOT\s+IN|LIKE|NOT\s+LIKE|IS|IS\s+NOT)\b',
-            where_replacer,
-            sql,
-            flags=re.I
-        )
+        sql = _WHERE_RE.sub(where_replacer, sql)
         
         return sql
     
@@ -408,7 +404,7 @@ class SQLParameterizer:
                     param_name = self._make_param_name("join_col", "string")
                     self._add_param(param_name, "string", f"Column to join on", col_name)
                     left_result = f"{table_ref}.{{{{.{param_name}}}}}"
-            elif re.match(r'^[a-zA-Z_][\w]*$', left_col):
+            elif _IDENTIFIER_RE.match(left_col):
                 param_name = self._make_param_name("join_col", "string")
                 self._add_param(param_name, "string", f"Column to join on", left_col)
                 left_result = f"{{{{.{param_name}}}}}"
@@ -423,7 +419,7 @@ class SQLParameterizer:
                     param_name = self._make_param_name("join_col", "string")
                     self._add_param(param_name, "string", f"Column to join on", col_name)
                     right_result = f"{table_ref}.{{{{.{param_name}}}}}"
-            elif re.match(r'^[a-zA-Z_][\w]*$', right_col):
+            elif _IDENTIFIER_RE.match(right_col):
                 param_name = self._make_param_name("join_col", "string")
                 self._add_param(param_name, "string", f"Column to join on", right_col)
                 right_result = f"{{{{.{param_name}}}}}"
@@ -431,11 +427,6 @@ class SQLParameterizer:
             return f"{on_kw} {left_result} {operator} {right_result}"
         
         # ON t1.col1 = t2.col2
-        sql = re.sub(
-            r'\b(ON)\s+([a-zA-Z_][\w\.]+)\s*(=|!=|<>|>=|<=|>|<)\s*([a-zA-Z_][\w\.]+)',
-            join_replacer,
-            sql,
-            flags=re.I
-        )
+        sql = _JOIN_ON_RE.sub(join_replacer, sql)
         
         return sql
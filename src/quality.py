@@ -4,6 +4,17 @@
 import re
 from typing import Dict, Any, List, Tuple
 
+# Patterns used by the per-tool scorers, compiled once at import
+_STRING_LITERAL_SINGLE_RE = re.compile(r"'[^']{2,}'")
+_STRING_LITERAL_DOUBLE_RE = re.compile(r'"[^"]{2,}"')
+_PLACEHOLDER_RE = re.compile(r'\{\{\.[\w]+\}\}')
+_MULTI_DIGIT_RE = re.compile(r'\b\d{2,}\b')
+_FIXED_FROM_RE = re.compile(r'\bFROM\s+[a-zA-Z_]\w+(?!\s*\()')
+
+_AGGREGATES = ('COUNT(', 'SUM(', 'AVG(', 'MAX(', 'MIN(')
+_QUESTION_KEYWORDS = ('how many', 'what', 'which', 'list', 'show', 'return', 'find',
+                      'calculate', 'count', 'average', 'maximum', 'minimum', 'total')
+
 def calculate_parameter_score(params: List[Dict]) -> float:
     """Parameter quality score: 0-40 points"""
     if not params:
@@ -67,8 +78,7 @@ def calculate_complexity_score(sql: str) -> float:
         score += 7
     
     # Aggregate functions: +5 points
-    aggregates = ['COUNT(', 'SUM(', 'AVG(', 'MAX(', 'MIN(']
-    if any(agg in sql_upper for agg in aggregates):
+    if any(agg in sql_upper for agg in _AGGREGATES):
         score += 5
     
     # WHERE + HAVING: +3 points
@@ -105,9 +115,8 @@ def calculate_description_score(question: str, sql: str) -> float:
         score += 2
     
     # Contains useful keywords? (max 10 points)
-    keywords = ['how many', 'what', 'which', 'list', 'show', 'return', 'find', 
-                'calculate', 'count', 'average', 'maximum', 'minimum', 'total']
-    keyword_count = sum(1 for kw in keywords if kw in question.lower())
+    question_lower = question.lower()
+    keyword_count = sum(1 for kw in _QUESTION_KEYWORDS if kw in question_lower)
     score += min(keyword_count * 2, 10)
     
     return min(score, 20)
@@ -118,16 +127,16 @@ def calculate_reusability_score(sql: str, params: List[Dict]) -> float:
     
     # Penalize hardcoded values
     # String literals (single or double quotes)
-    if re.search(r"'[^']{2,}'", sql) or re.search(r'"[^"]{2,}"', sql):
+    if _STRING_LITERAL_SINGLE_RE.search(sql) or _STRING_LITERAL_DOUBLE_RE.search(sql):
         score -= 3
     
     # Hardcoded numbers (excluding LIMIT/OFFSET)
-    sql_without_params = re.sub(r'\{\{\.[\w]+\}\}', '', sql)
-    if re.search(r'\b\d{2,}\b', sql_without_params):  # Numbers like 10+
+    sql_without_params = _PLACEHOLDER_RE.sub('', sql)
+    if _MULTI_DIGIT_RE.search(sql_without_params):  # Numbers like 10+
         score -= 2
     
     # Fixed table/column names that were not parameterized
-    if re.search(r'\bFROM\s+[a-zA-Z_]\w+(?!\s*\()', sql) and '{{.table' not in sql:
+    if _FIXED_FROM_RE.search(sql) and '{{.table' not in sql:
         score -= 2
     
     return max(score, 0)
@@ -4,6 +4,29 @@
 import re
 from typing import Dict, Any, List, Tuple
 
+# Patterns used by convert(), compiled once at import
+_SCHEMA_STMT_RE = re.compile(r'\b(CREATE|ALTER)\b', re.I)
+_PLACEHOLDER_RE = re.compile(r'\{\{\.(\w+)\}\}')
+_LIMIT_RE = re.compile(r'\bLIMIT\s+(\d+)', re.I)
+_OFFSET_VALUE_RE = re.compile(r'OFFSET\s+(\d+)', re.I)
+_BARE_OFFSET_RE = re.compile(r'\bOFFSET\s+(\d+)(?!\s+ROWS)', re.I)
+_NOW_RE = re.compile(r'\bNOW\(\)', re.I)
+_CURDATE_RE = re.compile(r'\bCURDATE\(\)', re.I)
+_CURTIME_RE = re.compile(r'\bCURTIME\(\)', re.I)
+_DATE_ADD_RE = re.compile(r'DATE_ADD\(([^,]+),\s*INTERVAL\s+(\d+)\s+(\w+)\)', re.I)
+_DATE_ADD_DAYS_RE = re.compile(r'DATE_ADD\(([^,]+),\s*INTERVAL\s+(\d+)\s+DAY\)', re.I)
+_LENGTH_RE = re.compile(r'\bLENGTH\(', re.I)
+_BOOLEAN_RE = re.compile(r'\bBOOLEAN\b', re.I)
+_AUTO_INCREMENT_RE = re.compile(r'\bAUTO_INCREMENT\b', re.I)
+_SPACED_AUTO_INCREMENT_RE = re.compile(r'\s+AUTO_INCREMENT', re.I)
+_TINYINT_WIDTH_RE = re.compile(r'\bTINYINT\(\d+\)', re.I)
+
+# Map MySQL INTERVAL types to SQL Server datepart
+_DATEPART_MAP = {
+    'DAY': 'day', 'MONTH': 'month', 'YEAR': 'year',
+    'HOUR': 'hour', 'MINUTE': 'minute', 'SECOND': 'second'
+}
+
 class SQLDialectConverter:
     """Converts SQL queries from one dialect to another"""
     
@@ -68,7 +91,7 @@ class SQLDialectConverter:
         converted_sql = self._convert_string_functions(converted_sql)
         
         # 5. Convert data types (if schema statements detected)
-        if re.search(r'\b(CREATE|ALTER)\b', converted_sql, re.I):
+        if _SCHEMA_STMT_RE.search(converted_sql):
             converted_sql = self._convert_data_types(converted_sql)
         
         return converted_sql, converted_params
@@ -83,7 +106,7 @@ class SQLDialectConverter:
         - SQL Server: @param_name
         """
         # Extract all parameter placeholders
-        placeholders = re.findall(r'\{\{\.(\w+)\}\}', sql)
+        placeholders = _PLACEHOLDER_RE.findall(sql)
         
         if not placeholders:
             return sql, params
@@ -142,7 +165,7 @@ class SQLDialectConverter:
         # Pattern: LIMIT n [OFFSET m] or OFFSET m LIMIT n
         def replace_limit_offset(match):
             limit_value = match.group(1)
-            offset_match = re.search(r'OFFSET\s+(\d+)', sql[max(0, match.start()-30):match.end()+30], re.I)
+            offset_match = _OFFSET_VALUE_RE.search(sql[max(0, match.start()-30):match.end()+30])
             
             if offset_match:
                 offset_value = offset_match.group(1)
@@ -151,10 +174,10 @@ class SQLDialectConverter:
                 return f"OFFSET 0 ROWS FETCH NEXT {limit_value} ROWS ONLY"
         
         # Replace LIMIT n (with optional OFFSET m)
-        sql = re.sub(r'\bLIMIT\s+(\d+)', replace_limit_offset, sql, flags=re.I)
+        sql = _LIMIT_RE.sub(replace_limit_offset, sql)
         
         # Replace standalone OFFSET (without LIMIT before it)
-        sql = re.sub(r'\bOFFSET\s+(\d+)(?!\s+ROWS)', r'OFFSET \1 ROWS', sql, flags=re.I)
+        sql = _BARE_OFFSET_RE.sub(r'OFFSET \1 ROWS', sql)
         
         return sql
     
@@ -169,9 +192,9 @@ class SQLDialectConverter:
         """
         if self.target_dialect == 'sql_server':
             # MySQL to SQL Server
-            sql = re.sub(r'\bNOW\(\)', 'GETDATE()', sql, flags=re.I)
-            sql = re.sub(r'\bCURDATE\(\)', 'CAST(GETDATE() AS DATE)', sql, flags=re.I)
-            sql = re.sub(r'\bCURTIME\(\)', 'CAST(GETDATE() AS TIME)', sql, flags=re.I)
+            sql = _NOW_RE.sub('GETDATE()', sql)
+            sql = _CURDATE_RE.sub('CAST(GETDATE() AS DATE)', sql)
+            sql = _CURTIME_RE.sub('CAST(GETDATE() AS TIME)', sql)
             
             # DATE_ADD/DATE_SUB conversion (simplified - keep for basic cases)
             # DATE_ADD(date, INTERVAL n DAY) -> DATEADD(DAY, n, date)
@@ -179,41 +202,25 @@ class SQLDialectConverter:
                 date_expr = match.group(1)
                 interval_val = match.group(2)
                 interval_type = match.group(3).upper()
-                
-                # Map MySQL INTERVAL types to SQL Server datepart
-                datepart_map = {
-                    'DAY': 'day', 'MONTH': 'month', 'YEAR': 'year',
-                    'HOUR': 'hour', 'MINUTE': 'minute', 'SECOND': 'second'
-                }
-                datepart = datepart_map.get(interval_type, 'day')
+                datepart = _DATEPART_MAP.get(interval_type, 'day')
                 
                 return f"DATEADD({datepart}, {interval_val}, {date_expr})"
             
-            sql = re.sub(
-                r'DATE_ADD\(([^,]+),\s*INTERVAL\s+(\d+)\s+(\w+)\)',
-                date_add_converter,
-                sql,
-                flags=re.I
-            )
+            sql = _DATE_ADD_RE.sub(date_add_converter, sql)
         
         elif self.target_dialect == 'postgres':
             # MySQL to PostgreSQL
-            sql = re.sub(r'\bCURDATE\(\)', 'CURRENT_DATE', sql, flags=re.I)
-            sql = re.sub(r'\bCURTIME\(\)', 'CURRENT_TIME', sql, flags=re.I)
+            sql = _CURDATE_RE.sub('CURRENT_DATE', sql)
+            sql = _CURTIME_RE.sub('CURRENT_TIME', sql)
         
         elif self.target_dialect == 'sqlite':
             # MySQL to SQLite
-            sql = re.sub(r'\bNOW\(\)', "datetime('now')", sql, flags=re.I)
-            sql = re.sub(r'\bCURDATE\(\)', "date('now')", sql, flags=re.I)
-            sql = re.sub(r'\bCURTIME\(\)', "time('now')", sql, flags=re.I)
+            sql = _NOW_RE.sub("datetime('now')", sql)
+            sql = _CURDATE_RE.sub("date('now')", sql)
+            sql = _CURTIME_RE.sub("time('now')", sql)
             
             # DATE_ADD/DATE_SUB to SQLite strftime/date
-            sql = re.sub(
-                r'DATE_ADD\(([^,]+),\s*INTERVAL\s+(\d+)\s+DAY\)',
-                r"date(\1, '+\\2 days')",
-                sql,
-                flags=re.I
-            )
+            sql = _DATE_ADD_DAYS_RE.sub(r"date(\1, '+\\2 days')", sql)
         
         return sql
     
@@ -228,7 +235,7 @@ class SQLDialectConverter:
         """
         if self.target_dialect == 'sql_server':
             # MySQL to SQL Server
-            sql = re.sub(r'\bLENGTH\(', 'LEN(', sql, flags=re.I)
+            sql = _LENGTH_RE.sub('LEN(', sql)
             
             # CONCAT is supported in SQL Server (2012+)
             # Keep CONCAT as is if it exists
@@ -257,40 +264,25 @@ class SQLDialectConverter:
         """
         if self.target_dialect == 'sql_server':
             # BOOLEAN -> BIT
-            sql = re.sub(r'\bBOOLEAN\b', 'BIT', sql, flags=re.I)
+            sql = _BOOLEAN_RE.sub('BIT', sql)
             
             # AUTO_INCREMENT -> IDENTITY(1,1)
-            sql = re.sub(
-                r'\bAUTO_INCREMENT\b',
-                'IDENTITY(1,1)',
-                sql,
-                flags=re.I
-            )
+            sql = _AUTO_INCREMENT_RE.sub('IDENTITY(1,1)', sql)
             
             # TINYINT(n) -> TINYINT
-            sql = re.sub(r'\bTINYINT\(\d+\)', 'TINYINT', sql, flags=re.I)
+            sql = _TINYINT_WIDTH_RE.sub('TINYINT', sql)
         
         elif self.target_dialect == 'postgres':
             # BOOLEAN -> BOOLEAN (same, but handle syntax)
             # AUTO_INCREMENT -> SERIAL or IDENTITY
-            sql = re.sub(
-                r'\s+AUTO_INCREMENT',
-                ' SERIAL',
-                sql,
-                flags=re.I
-            )
+            sql = _SPACED_AUTO_INCREMENT_RE.sub(' SERIAL', sql)
         
         elif self.target_dialect == 'sqlite':
             # BOOLEAN -> INTEGER (SQLite doesn't have BOOLEAN)
-            sql = re.sub(r'\bBOOLEAN\b', 'INTEGER', sql, flags=re.I)
+            sql = _BOOLEAN_RE.sub('INTEGER', sql)
             
             # AUTO_INCREMENT -> AUTOINCREMENT
-            sql = re.sub(
-                r'\bAUTO_INCREMENT\b',
-                'AUTOINCREMENT',
-                sql,
-                flags=re.I
-            )
+            sql = _AUTO_INCREMENT_RE.sub('AUTOINCREMENT', sql)
         
         return sql
 
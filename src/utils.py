@@ -3,14 +3,20 @@
 
 import re
 import hashlib
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple, Union
 
 # ====== Settings ======
 SAFE = re.compile(r"[^a-z0-9_]+")
 
-def sha(s: str, n=8): 
-    """Generate SHA1 hash of string, truncated to n characters"""
-    return hashlib.sha1(s.encode("utf-8")).hexdigest()[:n]
+@lru_cache(maxsize=8192)
+def sha(s: Union[str, Tuple[str, ...]], n=8): 
+    """Generate SHA1 hash of string, truncated to n characters.
+    A tuple of strings hashes the same as their concatenation without building it."""
+    h = hashlib.sha1()
+    for part in ((s,) if isinstance(s, str) else s):
+        h.update(part.encode("utf-8"))
+    return h.hexdigest()[:n]
 
 def slug(s: str, prefix="tool"):
     """Convert string to URL-safe slug"""
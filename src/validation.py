@@ -5,8 +5,12 @@ import re
 from typing import Dict, Any, List, Tuple
 from .quality import calculate_tool_quality_score, generate_semantic_description
 from .labels import generate_labels
+from .parameterizer import SQLParameterizer
 from .utils import sha, generate_smart_tool_name
 
+_TRIVIAL_SELECT_RE = re.compile(r'^\s*SELECT\s+\*\s+FROM\s+\w+\s*;?\s*$', re.I)
+_PLACEHOLDER_NAME_RE = re.compile(r'\{\{\.(\w+)\}\}')
+
 def validate_tool(sql: str, params: List[Dict], question: str) -> Tuple[bool, str]:
     """Legacy validation - kept for backward compatibility"""
     is_valid, msg, _ = validate_tool_advanced(sql, params, question, min_score=0.0)
@@ -26,11 +30,11 @@ def validate_tool_advanced(sql: str, params: List[Dict], question: str,
         return False, "No parameters - not reusable", 0.0
     
     # Check for overly simple SQL
-    if re.match(r'^\s*SELECT\s+\*\s+FROM\s+\w+\s*;?\s*$', sql, re.I):
+    if _TRIVIAL_SELECT_RE.match(sql):
         return False, "Too simple - just SELECT * FROM table", 0.0
     
     # Ensure parameters appear in the SQL
-    params_in_sql = set(re.findall(r'\{\{\.(\w+)\}\}', sql))
+    params_in_sql = set(_PLACEHOLDER_NAME_RE.findall(sql))
     if not params_in_sql:
         return False, "Parameters defined but not used in SQL", 0.0
     
@@ -51,8 +55,6 @@ def validate_tool_advanced(sql: str, params: List[Dict], question: str,
 def create_tool(rec_norm: Dict[str,Any], kind: str, source_name: str, 
                 parameterize_tables: bool = True, min_score: float = 50.0) -> Tuple[Dict[str,Any], str]:
     """Create an MCP tool definition from a normalized record"""
-    from .parameterizer import SQLParameterizer
-    
     # Parameterize the SQL statement
     parameterizer = SQLParameterizer(
         parameterize_tables=parameterize_tables,
@@ -70,7 +72,7 @@ def create_tool(rec_norm: Dict[str,Any], kind: str, source_name: str,
     
     # Generate a tool name
     smart_name = generate_smart_tool_name(parameterized_sql, rec_norm["question"])
-    key = f"{smart_name}_{sha(rec_norm['sql'] + rec_norm['question'], n=4)}"
+    key = f"{smart_name}_{sha((rec_norm['sql'], rec_norm['question']), n=4)}"
     
     # Build description (without reusing the question verbatim)
     base_desc = generate_semantic_description(parameterized_sql, rec_norm["question"], params)